@@ -14,7 +14,7 @@ from openai import OpenAI
 from openai.types.chat import ChatCompletion
 
 from src.core.interfaces import ContentGenerator
-from src.utils.metadata_enhancer import track_performance, track_llm_usage, update_job_status
+from src.utils.metadata_enhancer import track_performance, track_batch
 
 class OpenAIContentGenerator(ContentGenerator):
     """OpenAI API를 사용하여 콘텐츠를 생성하는 구현체"""
@@ -113,18 +113,18 @@ class OpenAIContentGenerator(ContentGenerator):
                 }
                 result['generated_with'] = self.model
                 
-                # 토큰 사용량 및 비용 추적
-                track_llm_usage(
-                    job_id=job_id,
-                    service_name="openai",
-                    tokens_used=total_tokens,
-                    requests_made=1,
-                    model_name=self.model
-                )
-                
-                # 성능 측정 완료
+                # 토큰 사용량/비용 추적 및 성능 측정 완료
                 end_time = time.time()
-                track_performance(job_id, "content_generation", start_time, end_time)
+                track_batch(job_id, [
+                    {
+                        'kind': 'llm_usage',
+                        'service_name': "openai",
+                        'tokens_used': total_tokens,
+                        'requests_made': 1,
+                        'model_name': self.model
+                    },
+                    {'kind': 'performance', 'operation': 'content_generation', 'start_time': start_time, 'end_time': end_time}
+                ])
                 
                 return result
                 
@@ -143,8 +143,10 @@ class OpenAIContentGenerator(ContentGenerator):
             
             # 오류 발생 시에도 메타데이터 기록
             end_time = time.time()
-            track_performance(job_id, "content_generation", start_time, end_time)
-            update_job_status(job_id, "failed", str(e))
+            track_batch(job_id, [
+                {'kind': 'performance', 'operation': 'content_generation', 'start_time': start_time, 'end_time': end_time},
+                {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+            ])
             
             return {
                 'title': f"[오류] {article.get('title', '')}",
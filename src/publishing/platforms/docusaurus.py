@@ -17,7 +17,7 @@ from github import GithubException
 import re
 
 from src.core.interfaces import Publisher
-from src.utils.metadata_enhancer import update_job_status, track_performance
+from src.utils.metadata_enhancer import update_job_status, track_batch
 
 class DocusaurusPublisher(Publisher):
     """GitHub 기반 Docusaurus 블로그 퍼블리셔 구현"""
@@ -338,8 +338,10 @@ class DocusaurusPublisher(Publisher):
             # 성능 측정 완료
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "publishing", start_time, end_time)
-                update_job_status(job_id, "success")
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'publishing', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'status', 'status': 'success'}
+                ])
             
             return result
             
@@ -349,8 +351,10 @@ class DocusaurusPublisher(Publisher):
             # 오류 발생 시에도 메타데이터 기록
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "publishing", start_time, end_time)
-                update_job_status(job_id, "failed", str(e))
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'publishing', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+                ])
             
             # 실패 결과 반환
             result['status'] = 'error'
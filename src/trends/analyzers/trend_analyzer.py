@@ -15,7 +15,7 @@ from collections import Counter
 import time
 
 from src.core.interfaces import TrendAnalyzer
-from src.utils.metadata_enhancer import update_job_metadata, track_performance, track_llm_usage, update_job_status
+from src.utils.metadata_enhancer import update_job_metadata, track_performance, track_llm_usage, track_batch
 
 class GNewsTrendAnalyzer(TrendAnalyzer):
     """수집된 뉴스 기사를 분석하고 점수를 매기는 클래스"""
@@ -53,6 +53,16 @@ class GNewsTrendAnalyzer(TrendAnalyzer):
             'low': ['뜻', '의미', '근황', '사연', '이유', '이슈', '논란', '발언', '소식', '행사', '일정']
         }
         
+        # 카테고리별 블로그 주제 형식
+        self._topic_templates = {
+            'tech': '최신 기술 트렌드: {title}',
+            'business': '비즈니스 인사이트: {title}',
+            'health': '건강 가이드: {title}',
+            'lifestyle': '라이프스타일 트렌드: {title}',
+            'education': '교육 및 학습: {title}',
+            'social': '사회 이슈: {title}',
+        }
+        
         # 트렌드 분석 상태
         self.analyzed_trends = []
         self.history = {}  # 과거 트렌드 기록
@@ -113,8 +123,10 @@ class GNewsTrendAnalyzer(TrendAnalyzer):
             # 오류 발생 시에도 메타데이터 기록
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                update_job_status(job_id, "failed", str(e))
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+                ])
             
             raise
 
@@ -280,7 +292,7 @@ class GNewsTrendAnalyzer(TrendAnalyzer):
         source = article.get('source', {}).get('name', '')
         published_at = article.get('published_at', '')
         
-        # 날짜 포맷 변경
+        # 날짜 포맷 변경 (게시 시각의 원래 시간대 기준, published_ts는 정렬에만 사용)
         try:
             pub_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
             formatted_date = pub_date.strftime('%Y년 %m월 %d일')
@@ -303,23 +315,8 @@ class GNewsTrendAnalyzer(TrendAnalyzer):
         title = article.get('title', '')
         keywords = article.get('keywords', [])
         
-        # 제목에서 블로그 주제 추출 시도
-        topic = title
-        
-        # 카테고리에 따른 주제 형식 적용
+        # 카테고리에 따른 주제 형식 적용 (정의되지 않은 카테고리는 제목 그대로 사용)
         primary_category = categories[0] if categories else 'general'
+        template = self._topic_templates.get(primary_category, '{title}')
         
-        if primary_category == 'tech':
-            topic = f"최신 기술 트렌드: {title}"
-        elif primary_category == 'business':
-            topic = f"비즈니스 인사이트: {title}"
-        elif primary_category == 'health':
-            topic = f"건강 가이드: {title}"
-        elif primary_category == 'lifestyle':
-            topic = f"라이프스타일 트렌드: {title}"
-        elif primary_category == 'education':
-            topic = f"교육 및 학습: {title}"
-        elif primary_category == 'social':
-            topic = f"사회 이슈: {title}"
-        
-        return topic 
\ No newline at end of file
+        return template.format(title=title) 
\ No newline at end of file
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 파서에서 공통으로 사용하는 블랙리스트 검사 모듈
+"""
+
+import re
+from typing import Iterable
+
+try:
+    import ahocorasick  # 선택 의존성 (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+class BlacklistMatcher:
+    """텍스트에 블랙리스트 용어가 포함되어 있는지 대소문자 구분 없이 검사하는 클래스"""
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        블랙리스트 검사기를 초기화합니다.
+
+        pyahocorasick이 설치되어 있으면 Aho-Corasick 오토마톤을, 아니면
+        대소문자 무시 정규식을 한 번만 만들어 둡니다.
+
+        Args:
+            terms (Iterable[str]): 블랙리스트 용어 목록
+        """
+        self.terms = tuple(terms)
+        self._automaton = None
+        self._pattern = None
+
+        if not self.terms:
+            return
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for term in self.terms:
+                automaton.add_word(term.lower(), term)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._pattern = re.compile('|'.join(re.escape(term) for term in self.terms), re.IGNORECASE)
+
+    def __bool__(self) -> bool:
+        """블랙리스트 용어가 하나라도 있는지 여부"""
+        return bool(self.terms)
+
+    def contains(self, text: str) -> bool:
+        """
+        텍스트에 블랙리스트 용어가 포함되어 있는지 확인합니다.
+
+        Args:
+            text (str): 확인할 텍스트
+
+        Returns:
+            bool: 블랙리스트 포함 여부
+        """
+        # 블랙리스트가 비어 있으면 텍스트 복사 없이 바로 반환
+        if not self.terms or not text:
+            return False
+
+        # 오토마톤이 있으면 블랙리스트 크기와 관계없이 텍스트를 한 번만 스캔
+        if self._automaton is not None:
+            return next(self._automaton.iter(text.lower()), None) is not None
+
+        # 대소문자 무시 정규식으로 소문자 복사본 없이 원본 텍스트를 스캔
+        return self._pattern.search(text) is not None
@@ -5,6 +5,7 @@
 GNews API를 활용한 뉴스 트렌드 파싱 모듈
 """
 
+import heapq
 import logging
 import requests
 import time
@@ -16,7 +17,8 @@ import os
 from urllib.parse import quote
 
 from src.core.interfaces import TrendParser
-from src.utils.metadata_enhancer import track_performance, track_api_usage, update_job_status
+from src.trends.parsers.blacklist import BlacklistMatcher
+from src.utils.metadata_enhancer import track_batch, update_job_status
 
 class GNewsParser(TrendParser):
     """GNews API를 사용하여 최신 뉴스에서 트렌드를 파악하는 클래스"""
@@ -46,6 +48,7 @@ class GNewsParser(TrendParser):
         
         # 키워드 필터링
         self.blacklist = config.get('trends', {}).get('analysis', {}).get('blacklist', [])
+        self._blacklist_matcher = BlacklistMatcher(self.blacklist)
         
         # API 요청 제한 관리
         self.last_request_time = 0
@@ -83,10 +86,13 @@ class GNewsParser(TrendParser):
         api_calls = 0  # API 호출 횟수 추적
         
         try:
+            # 시간 범위 설정 (최근 n시간) - 모든 카테고리에 동일한 기준 적용
+            from_date = self._get_from_date()
+            
             # 최근 기사 가져오기
             all_articles = []
             for category in self.categories:
-                category_articles = self._fetch_top_news(category)
+                category_articles = self._fetch_top_news(category, from_date)
                 all_articles.extend(category_articles)
                 api_calls += 1  # 카테고리마다 API 호출 1회
                 self.logger.info(f"{category} 카테고리에서 {len(category_articles)}개 기사 가져옴")
@@ -98,9 +104,11 @@ class GNewsParser(TrendParser):
                 # 작업 추적 종료
                 if job_id:
                     end_time = time.time()
-                    track_performance(job_id, "trend_analysis", start_time, end_time)
-                    track_api_usage(job_id, "news", requests_made=api_calls)
-                    update_job_status(job_id, "success")
+                    track_batch(job_id, [
+                        {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                        {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                        {'kind': 'status', 'status': 'success'}
+                    ])
                 return []
             
             # 중복 제거 및 기사 필터링
@@ -114,11 +122,13 @@ class GNewsParser(TrendParser):
             # 작업 추적 종료
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "success")
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'success'}
+                ])
             
-            return trending_articles[:self.max_trends]
+            return trending_articles
             
         except Exception as e:
             self.logger.error(f"뉴스 가져오기 중 오류 발생: {str(e)}")
@@ -126,18 +136,30 @@ class GNewsParser(TrendParser):
             # 오류 발생 시에도 작업 추적
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "failed", str(e))
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+                ])
             
             return []
     
-    def _fetch_top_news(self, category: str) -> List[Dict[str, Any]]:
+    def _get_from_date(self) -> str:
+        """
+        검색 시간 범위의 시작 시각을 GNews API 형식으로 반환합니다.
+        
+        Returns:
+            str: 최근 n시간 기준 시작 시각
+        """
+        return (datetime.now() - timedelta(hours=self.time_window_hours)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def _fetch_top_news(self, category: str, from_date: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         GNews API를 통해 특정 카테고리의 최신 뉴스를 가져옵니다.
         
         Args:
             category (str): 뉴스 카테고리
+            from_date (Optional[str]): 검색 시작 시각 (없으면 현재 시각 기준으로 계산)
             
         Returns:
             List[Dict[str, Any]]: 최신 뉴스 기사 목록
@@ -149,7 +171,8 @@ class GNewsParser(TrendParser):
             time.sleep(self.request_interval - elapsed)
         
         # 시간 범위 설정 (최근 n시간)
-        from_date = (datetime.now() - timedelta(hours=self.time_window_hours)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        if from_date is None:
+            from_date = self._get_from_date()
         
         endpoint = f"{self.api_base_url}/top-headlines"
         params = {
@@ -177,33 +200,36 @@ class GNewsParser(TrendParser):
                 self.logger.error(f"GNews API 응답에 'articles' 필드가 없습니다: {data}")
                 return []
             
-            # 필요한 정보만 추출하여 저장
-            processed_articles = []
-            for article in data['articles']:
-                # 블랙리스트 키워드 체크
+            def make_entry(article: Dict[str, Any]) -> Dict[str, Any]:
+                """API 응답 기사를 표준 형식으로 변환합니다."""
                 title = article.get('title', '')
                 description = article.get('description', '')
-                content = article.get('content', '')
-                
-                if self._contains_blacklisted_terms(f"{title} {description} {content}"):
-                    continue
-                
-                # 기사 정보 저장
-                processed = {
+                published_at = article.get('publishedAt', '')
+                source = article.get('source', {})
+                return {
                     'title': title,
                     'description': description,
-                    'content': content,
+                    'content': article.get('content', ''),
                     'url': article.get('url', ''),
-                    'published_at': article.get('publishedAt', ''),
+                    'published_at': published_at,
+                    'published_ts': self._parse_published_ts(published_at),
                     'source': {
-                        'name': article.get('source', {}).get('name', ''),
-                        'url': article.get('source', {}).get('url', '')
+                        'name': source.get('name', ''),
+                        'url': source.get('url', '')
                     },
                     'category': category,
                     'image': article.get('image', ''),
                     'keywords': self._extract_keywords(f"{title} {description}")
                 }
-                processed_articles.append(processed)
+            
+            # 블랙리스트 키워드가 없는 기사만 필요한 정보를 추출하여 저장
+            processed_articles = [
+                make_entry(article)
+                for article in data['articles']
+                if not self._contains_blacklisted_terms(
+                    f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
+                )
+            ]
             
             return processed_articles
             
@@ -211,6 +237,21 @@ class GNewsParser(TrendParser):
             self.logger.error(f"GNews API 요청 중 오류 발생: {str(e)}")
             return []
     
+    def _parse_published_ts(self, published_at: str) -> float:
+        """
+        ISO-8601 형식의 게시 시각을 타임스탬프로 변환합니다.
+        
+        Args:
+            published_at (str): 게시 시각 문자열 (예: 2023-01-01T12:00:00Z)
+            
+        Returns:
+            float: 타임스탬프 (파싱 실패 시 0)
+        """
+        try:
+            return datetime.fromisoformat(published_at.replace('Z', '+00:00')).timestamp()
+        except (ValueError, AttributeError):
+            return 0
+    
     def _filter_and_deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         기사 목록에서 중복을 제거하고 필터링합니다.
@@ -222,19 +263,13 @@ class GNewsParser(TrendParser):
             List[Dict[str, Any]]: 필터링된 기사 목록
         """
         # URL 기준으로 중복 제거
-        unique_articles = {}
+        # (블랙리스트 필터링은 _fetch_top_news에서 이미 수행됨)
+        seen_urls = set()
+        filtered_articles = []
         for article in articles:
             url = article.get('url', '')
-            if url and url not in unique_articles:
-                unique_articles[url] = article
-        
-        # 블랙리스트 필터링 다시 한번 수행
-        filtered_articles = []
-        for url, article in unique_articles.items():
-            title = article.get('title', '')
-            description = article.get('description', '')
-            
-            if not self._contains_blacklisted_terms(f"{title} {description}"):
+            if url and url not in seen_urls:
+                seen_urls.add(url)
                 filtered_articles.append(article)
         
         return filtered_articles
@@ -249,15 +284,8 @@ class GNewsParser(TrendParser):
         Returns:
             List[Dict[str, Any]]: 트렌드 기사 목록
         """
-        # 게시 시간 기준으로 정렬 (최신순)
-        sorted_articles = sorted(
-            articles, 
-            key=lambda x: x.get('published_at', ''),
-            reverse=True
-        )
-        
         # 트렌드 점수 계산 (새로운 필드 추가)
-        for article in sorted_articles:
+        for article in articles:
             # 1. 카테고리 가중치 (일부 카테고리는 더 중요할 수 있음)
             category_weight = 1.0
             if article.get('category') in ['technology', 'business']:
@@ -276,14 +304,12 @@ class GNewsParser(TrendParser):
             
             article['trend_score'] = min(100, trend_score)
         
-        # 트렌드 점수로 정렬
-        trending_articles = sorted(
-            sorted_articles, 
-            key=lambda x: x.get('trend_score', 0),
-            reverse=True
+        # 트렌드 점수 상위 기사 선택 (동점이면 최신 기사 우선)
+        return heapq.nlargest(
+            self.max_trends,
+            articles,
+            key=lambda x: (x.get('trend_score', 0), x.get('published_ts', 0))
         )
-        
-        return trending_articles
     
     def _contains_blacklisted_terms(self, text: str) -> bool:
         """
@@ -295,11 +321,7 @@ class GNewsParser(TrendParser):
         Returns:
             bool: 블랙리스트 포함 여부
         """
-        if not text:
-            return False
-            
-        text_lower = text.lower()
-        return any(term.lower() in text_lower for term in self.blacklist)
+        return self._blacklist_matcher.contains(text)
 
     def _extract_keywords(self, text: str) -> List[str]:
         """
@@ -350,6 +372,11 @@ class GNewsParser(TrendParser):
                     compound = f"{words[i]} {words[i+1]}"
                     keywords.append(compound)
         
-        # 중복 제거 및 상위 10개 반환
-        unique_keywords = list(set(keywords))
-        return unique_keywords[:10]
\ No newline at end of file
+        # 중복 제거 및 상위 10개 반환 (등장 순서 유지)
+        unique_keywords = {}
+        for keyword in keywords:
+            if keyword not in unique_keywords:
+                unique_keywords[keyword] = None
+                if len(unique_keywords) == 10:
+                    break
+        return list(unique_keywords)
\ No newline at end of file
@@ -5,16 +5,43 @@
 네이버 뉴스 API를 활용한 뉴스 트렌드 파싱 모듈
 """
 
+import asyncio
+import heapq
 import logging
-import requests
+import httpx
 import time
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import re
+import html
+from itertools import chain
+from urllib.parse import urlsplit
 
 from src.core.interfaces import TrendParser
-from src.utils.metadata_enhancer import track_performance, track_api_usage, update_job_status
+from src.trends.parsers.blacklist import BlacklistMatcher
+from src.utils.metadata_enhancer import track_batch, update_job_status
+
+# 자주 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+# 도메인별 출판사 매핑 (간단한 예시)
+_PUBLISHER_MAPPING = {
+    'news.naver.com': '네이버 뉴스',
+    'n.news.naver.com': '네이버 뉴스',
+    'news.joins.com': '중앙일보',
+    'www.chosun.com': '조선일보',
+    'news.sbs.co.kr': 'SBS 뉴스',
+    'news.kbs.co.kr': 'KBS 뉴스',
+    'news.imbc.com': 'MBC 뉴스',
+    'www.yonhapnewstv.co.kr': '연합뉴스',
+    'www.hani.co.kr': '한겨레',
+    'www.khan.co.kr': '경향신문'
+}
+
+# 신뢰도 가중치를 부여하는 주요 언론사
+_PREMIUM_SOURCES = frozenset(['네이버 뉴스', '중앙일보', '조선일보', 'KBS 뉴스', 'MBC 뉴스', 'SBS 뉴스', '연합뉴스'])
 
 class NaverNewsParser(TrendParser):
     """네이버 뉴스 API를 사용하여 최신 뉴스 트렌드를 파악하는 클래스"""
@@ -44,13 +71,18 @@ class NaverNewsParser(TrendParser):
         
         # 키워드 필터링
         self.blacklist = config.get('trends', {}).get('analysis', {}).get('blacklist', [])
+        self._blacklist_matcher = BlacklistMatcher(self.blacklist)
         
         # API 요청 제한 관리
-        self.last_request_time = 0
-        self.request_interval = 0.3  # 초 단위 (네이버 API 요청 제한 준수)
+        self.request_interval = 0.3  # 초 단위 (요청 시작 간격, 네이버 API 요청 제한 준수)
+        self.max_concurrent_requests = config.get('trends', {}).get('naver', {}).get('max_concurrent_requests', 3)  # 동시 요청 수
         
-        # HTTP 세션 초기화
-        self.session = requests.Session()
+        # HTTP 클라이언트 설정 (HTTP/2 멀티플렉싱, 커넥션 재사용)
+        self.http_limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        self.http_timeout = 10.0  # 초 단위
+        
+        # 호스트별 출판사 정보 캐시 (host -> (출판사 이름, 도메인 URL))
+        self._host_cache: Dict[str, Tuple[str, str]] = {}
         
         if not self.client_id or not self.client_secret:
             self.logger.error("네이버 API 인증 정보가 설정되지 않았습니다.")
@@ -64,11 +96,23 @@ class NaverNewsParser(TrendParser):
             
         Returns:
             List[Dict[str, Any]]: 파싱된 뉴스 기사 목록
+            
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프 안에서 호출한 경우
         """
         if not self.client_id or not self.client_secret:
             self.logger.error("네이버 API 인증 정보가 없어 뉴스를 가져올 수 없습니다.")
             return []
         
+        # asyncio.run은 실행 중인 이벤트 루프 안에서 쓸 수 없으므로 빈 결과 대신 바로 오류를 알림
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("get_trends()는 실행 중인 이벤트 루프 안에서 호출할 수 없습니다. "
+                               "비동기 코드에서는 _fetch_all_news_async()를 직접 await 하세요.")
+        
         # 성능 측정 시작
         if job_id:
             update_job_status(job_id, "in_progress")
@@ -80,9 +124,11 @@ class NaverNewsParser(TrendParser):
             # 인기 키워드 목록 (여기서는 예시로 몇 가지 키워드 사용)
             popular_keywords = ["AI", "인공지능", "빅데이터", "클라우드", "메타버스", "블록체인"]
             
+            # 키워드별 요청을 동시에 수행
+            results = asyncio.run(self._fetch_all_news_async(popular_keywords))
+            
             all_articles = []
-            for keyword in popular_keywords:
-                keyword_articles = self._fetch_news(keyword)
+            for keyword, keyword_articles in zip(popular_keywords, results):
                 all_articles.extend(keyword_articles)
                 api_calls += 1
                 self.logger.info(f"키워드 '{keyword}'에서 {len(keyword_articles)}개 기사 가져옴")
@@ -94,9 +140,11 @@ class NaverNewsParser(TrendParser):
                 # 성능 추적 종료
                 if job_id:
                     end_time = time.time()
-                    track_performance(job_id, "trend_analysis", start_time, end_time)
-                    track_api_usage(job_id, "news", requests_made=api_calls)
-                    update_job_status(job_id, "success")
+                    track_batch(job_id, [
+                        {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                        {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                        {'kind': 'status', 'status': 'success'}
+                    ])
                 return []
             
             # 중복 제거 및 기사 필터링
@@ -110,11 +158,13 @@ class NaverNewsParser(TrendParser):
             # 성능 추적 종료
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "success")
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'success'}
+                ])
             
-            return trending_articles[:self.max_trends]
+            return trending_articles
             
         except Exception as e:
             self.logger.error(f"뉴스 가져오기 중 오류 발생: {str(e)}")
@@ -122,27 +172,71 @@ class NaverNewsParser(TrendParser):
             # 성능 추적 종료 (오류 상태)
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "failed", str(e))
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+                ])
             
             return []
     
-    def _fetch_news(self, query: str) -> List[Dict[str, Any]]:
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """
+        요청 묶음 단위로 사용할 비동기 HTTP 클라이언트를 생성합니다.
+        
+        클라이언트는 이벤트 루프에 묶이므로 asyncio.run 호출마다 새로 생성합니다.
+        
+        Returns:
+            httpx.AsyncClient: HTTP/2를 지원하는 비동기 클라이언트
+        """
+        return httpx.AsyncClient(http2=True, limits=self.http_limits, timeout=self.http_timeout)
+    
+    async def _fetch_all_news_async(self, queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        여러 키워드에 대한 뉴스를 하나의 세션에서 동시에 가져옵니다.
+        
+        Args:
+            queries (List[str]): 검색 키워드 목록
+            
+        Returns:
+            List[List[Dict[str, Any]]]: 키워드 순서대로 정렬된 뉴스 기사 목록
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async with self._create_http_client() as session:
+            tasks = [
+                self._fetch_news_async(session, semaphore, query, delay=index * self.request_interval)
+                for index, query in enumerate(queries)
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        processed_results = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"키워드 '{query}' 뉴스 가져오기 중 오류 발생: {str(result)}")
+                processed_results.append([])
+            else:
+                processed_results.append(result)
+        
+        return processed_results
+    
+    async def _fetch_news_async(self, session: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                query: str, delay: float = 0) -> List[Dict[str, Any]]:
         """
         네이버 뉴스 API를 통해 특정 키워드에 대한 뉴스를 가져옵니다.
         
         Args:
+            session (httpx.AsyncClient): HTTP 클라이언트
+            semaphore (asyncio.Semaphore): 동시 요청 수 제한
             query (str): 검색 키워드
+            delay (float): 요청 시작 전 대기 시간 (초, API 요청 제한 준수)
             
         Returns:
             List[Dict[str, Any]]: 뉴스 기사 목록
         """
-        # API 요청 제한 관리
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < self.request_interval:
-            time.sleep(self.request_interval - elapsed)
+        # API 요청 제한 관리 (요청 시작 시점 분산)
+        if delay:
+            await asyncio.sleep(delay)
         
         headers = {
             "X-Naver-Client-Id": self.client_id,
@@ -159,8 +253,8 @@ class NaverNewsParser(TrendParser):
         self.logger.debug(f"네이버 뉴스 API 호출: 키워드='{query}'")
         
         try:
-            response = self.session.get(self.api_url, params=params, headers=headers)
-            self.last_request_time = time.time()
+            async with semaphore:
+                response = await session.get(self.api_url, params=params, headers=headers)
             
             if response.status_code != 200:
                 self.logger.error(f"네이버 API 오류: {response.status_code} - {response.text}")
@@ -172,17 +266,26 @@ class NaverNewsParser(TrendParser):
                 self.logger.error(f"네이버 API 응답에 'items' 필드가 없습니다: {data}")
                 return []
             
+            # 루프 안에서 반복되는 메서드 조회를 줄이기 위해 지역 변수로 바인딩
+            strip_html = self._strip_html
+            contains_blacklisted_terms = self._contains_blacklisted_terms
+            get_publisher_info = self._get_publisher_info
+            extract_keywords = self._extract_keywords
+            
             # 응답 데이터를 표준 형식으로 변환
             processed_articles = []
             for item in data['items']:
                 # HTML 태그 제거
-                title = re.sub(r'<[^>]+>', '', item.get('title', ''))
-                description = re.sub(r'<[^>]+>', '', item.get('description', ''))
+                title = strip_html(item.get('title', ''))
+                description = strip_html(item.get('description', ''))
                 
                 # 블랙리스트 키워드 체크
-                if self._contains_blacklisted_terms(f"{title} {description}"):
+                if contains_blacklisted_terms(f"{title} {description}"):
                     continue
                 
+                # 출판사 정보 추출
+                publisher_name, publisher_url = get_publisher_info(item.get('link', ''))
+                
                 # 기사 정보 저장
                 processed = {
                     'title': title,
@@ -191,59 +294,73 @@ class NaverNewsParser(TrendParser):
                     'url': item.get('link', ''),
                     'published_at': item.get('pubDate', ''),
                     'source': {
-                        'name': self._extract_publisher_from_link(item.get('link', '')),
-                        'url': self._extract_publisher_domain(item.get('link', ''))
+                        'name': publisher_name,
+                        'url': publisher_url
                     },
                     'category': 'news',
                     'image': '',  # 네이버 API는 이미지 URL을 제공하지 않음
-                    'keywords': self._extract_keywords(f"{title} {description}")
+                    'keywords': extract_keywords(f"{title} {description}")
                 }
                 processed_articles.append(processed)
             
             return processed_articles
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"네이버 API 요청 중 오류 발생: {str(e)}")
             return []
     
-    def _extract_publisher_from_link(self, link: str) -> str:
-        """링크에서 출판사 이름을 추출합니다."""
-        if not link:
+    def _strip_html(self, text: str) -> str:
+        """
+        HTML 태그를 제거하고 HTML 엔티티를 디코딩합니다.
+        
+        Args:
+            text (str): HTML이 포함된 텍스트
+            
+        Returns:
+            str: 순수 텍스트
+        """
+        if not text:
             return ''
         
+        return html.unescape(_HTML_TAG_RE.sub('', text))
+    
+    def _get_publisher_info(self, link: str) -> Tuple[str, str]:
+        """
+        링크에서 출판사 이름과 도메인 URL을 추출합니다. (호스트 단위로 캐시)
+        
+        Args:
+            link (str): 기사 링크
+            
+        Returns:
+            Tuple[str, str]: (출판사 이름, 출판사 도메인 URL)
+        """
+        if not link:
+            return ('', '')
+        
         # 도메인 추출 (news.naver.com, n.news.naver.com 등)
-        domain_match = re.search(r'https?://([^/]+)', link)
-        if not domain_match:
-            return ''
+        try:
+            parts = urlsplit(link)
+        except ValueError:
+            return ('', '')
         
-        domain = domain_match.group(1)
-        
-        # 출판사 매핑 (간단한 예시)
-        publisher_mapping = {
-            'news.naver.com': '네이버 뉴스',
-            'n.news.naver.com': '네이버 뉴스',
-            'news.joins.com': '중앙일보',
-            'www.chosun.com': '조선일보',
-            'news.sbs.co.kr': 'SBS 뉴스',
-            'news.kbs.co.kr': 'KBS 뉴스',
-            'news.imbc.com': 'MBC 뉴스',
-            'www.yonhapnewstv.co.kr': '연합뉴스',
-            'www.hani.co.kr': '한겨레',
-            'www.khan.co.kr': '경향신문'
-        }
+        host = parts.netloc
+        if parts.scheme not in ('http', 'https') or not host:
+            return ('', '')
+        
+        publisher_info = self._host_cache.get(host)
+        if publisher_info is None:
+            publisher_info = (_PUBLISHER_MAPPING.get(host, host), f"https://{host}")
+            self._host_cache[host] = publisher_info
         
-        return publisher_mapping.get(domain, domain)
+        return publisher_info
+    
+    def _extract_publisher_from_link(self, link: str) -> str:
+        """링크에서 출판사 이름을 추출합니다."""
+        return self._get_publisher_info(link)[0]
     
     def _extract_publisher_domain(self, link: str) -> str:
         """링크에서 출판사 도메인을 추출합니다."""
-        if not link:
-            return ''
-        
-        domain_match = re.search(r'https?://([^/]+)', link)
-        if not domain_match:
-            return ''
-        
-        return f"https://{domain_match.group(1)}"
+        return self._get_publisher_info(link)[1]
     
     def _filter_and_deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -256,19 +373,13 @@ class NaverNewsParser(TrendParser):
             List[Dict[str, Any]]: 필터링된 기사 목록
         """
         # URL 기준으로 중복 제거
-        unique_articles = {}
+        # (블랙리스트 필터링은 기사 수집 시 이미 수행됨)
+        seen_urls = set()
+        filtered_articles = []
         for article in articles:
             url = article.get('url', '')
-            if url and url not in unique_articles:
-                unique_articles[url] = article
-        
-        # 블랙리스트 필터링 다시 한번 수행
-        filtered_articles = []
-        for url, article in unique_articles.items():
-            title = article.get('title', '')
-            description = article.get('description', '')
-            
-            if not self._contains_blacklisted_terms(f"{title} {description}"):
+            if url and url not in seen_urls:
+                seen_urls.add(url)
                 filtered_articles.append(article)
         
         return filtered_articles
@@ -283,19 +394,12 @@ class NaverNewsParser(TrendParser):
         Returns:
             List[Dict[str, Any]]: 트렌드 기사 목록
         """
-        # 게시 시간 기준으로 정렬 (최신순)
-        sorted_articles = sorted(
-            articles, 
-            key=lambda x: x.get('published_at', ''),
-            reverse=True
-        )
-        
         # 트렌드 점수 계산 (새로운 필드 추가)
-        for article in sorted_articles:
+        for article in articles:
             # 1. 소스 신뢰도 (향후 확장 가능)
             source_weight = 1.0
             source_name = article.get('source', {}).get('name', '')
-            if source_name in ['네이버 뉴스', '중앙일보', '조선일보', 'KBS 뉴스', 'MBC 뉴스', 'SBS 뉴스', '연합뉴스']:
+            if source_name in _PREMIUM_SOURCES:
                 source_weight = 1.2
             
             # 2. 콘텐츠 품질 (설명 길이 기반)
@@ -307,14 +411,8 @@ class NaverNewsParser(TrendParser):
             
             article['trend_score'] = min(100, trend_score)
         
-        # 트렌드 점수로 정렬
-        trending_articles = sorted(
-            sorted_articles, 
-            key=lambda x: x.get('trend_score', 0),
-            reverse=True
-        )
-        
-        return trending_articles
+        # 트렌드 점수 상위 기사 선택
+        return heapq.nlargest(self.max_trends, articles, key=lambda x: x['trend_score'])
     
     def _contains_blacklisted_terms(self, text: str) -> bool:
         """
@@ -326,11 +424,7 @@ class NaverNewsParser(TrendParser):
         Returns:
             bool: 블랙리스트 포함 여부
         """
-        if not text:
-            return False
-            
-        text_lower = text.lower()
-        return any(term.lower() in text_lower for term in self.blacklist)
+        return self._blacklist_matcher.contains(text)
 
     def _extract_keywords(self, text: str) -> List[str]:
         """
@@ -343,26 +437,30 @@ class NaverNewsParser(TrendParser):
             List[str]: 추출된 키워드 목록
         """
         # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', ' ', text)
+        text = _HTML_TAG_RE.sub(' ', text)
         
-        # 특수문자 제거
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # 단어 추출
-        words = text.split()
-        keywords = []
+        # 단어 추출 (특수문자를 제외한 단어를 한 번에 추출)
+        words = _WORD_RE.findall(text)
+        lengths = [len(word) for word in words]
         
         # 2글자 이상 키워드 (한글)
-        for word in words:
-            if len(word) >= 2 and re.match(r'[\uac00-\ud7a3]+', word):
-                keywords.append(word)
+        single_keywords = (
+            word for word, length in zip(words, lengths)
+            if length >= 2 and '\uac00' <= word[0] <= '\ud7a3'
+        )
         
         # 복합 키워드 (2단어)
-        for i in range(len(words) - 1):
-            if len(words[i]) >= 2 and len(words[i+1]) >= 2:
-                compound = f"{words[i]} {words[i+1]}"
-                keywords.append(compound)
-        
-        # 중복 제거 및 상위 10개 반환
-        unique_keywords = list(set(keywords))
-        return unique_keywords[:10]
+        compound_keywords = (
+            f"{first} {second}"
+            for first, second, first_length, second_length in zip(words, words[1:], lengths, lengths[1:])
+            if first_length >= 2 and second_length >= 2
+        )
+        
+        # 중복 제거 및 상위 10개 반환 (등장 순서 유지, 10개가 모이면 중단)
+        unique_keywords = {}
+        for keyword in chain(single_keywords, compound_keywords):
+            if keyword not in unique_keywords:
+                unique_keywords[keyword] = None
+                if len(unique_keywords) == 10:
+                    break
+        return list(unique_keywords)
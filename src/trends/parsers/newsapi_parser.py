@@ -5,8 +5,10 @@
 NewsAPI를 활용한 뉴스 트렌드 파싱 모듈
 """
 
+import asyncio
+import heapq
 import logging
-import requests
+import httpx
 import time
 import os
 from typing import List, Dict, Any, Optional
@@ -14,7 +16,12 @@ from datetime import datetime, timedelta
 import re
 
 from src.core.interfaces import TrendParser
-from src.utils.metadata_enhancer import track_performance, track_api_usage, update_job_status
+from src.trends.parsers.blacklist import BlacklistMatcher
+from src.utils.metadata_enhancer import track_batch, update_job_status
+
+# 자주 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+_WORD_RE = re.compile(r'\w+')
+_DOMAIN_RE = re.compile(r'https?://([^/]+)')
 
 class NewsAPIParser(TrendParser):
     """NewsAPI를 사용하여 최신 뉴스 트렌드를 파악하는 클래스"""
@@ -42,13 +49,15 @@ class NewsAPIParser(TrendParser):
         
         # 키워드 필터링
         self.blacklist = config.get('trends', {}).get('analysis', {}).get('blacklist', [])
+        self._blacklist_matcher = BlacklistMatcher(self.blacklist)
         
         # API 요청 제한 관리
-        self.last_request_time = 0
-        self.request_interval = 1.5  # 초 단위 (API 요청 제한 준수)
+        self.request_interval = 1.5  # 초 단위 (요청 시작 간격, API 요청 제한 준수)
+        self.max_concurrent_requests = config.get('trends', {}).get('newsapi', {}).get('max_concurrent_requests', 2)  # 동시 요청 수
         
-        # HTTP 세션 초기화
-        self.session = requests.Session()
+        # HTTP 클라이언트 설정 (HTTP/2 멀티플렉싱, 커넥션 재사용)
+        self.http_limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        self.http_timeout = 10.0  # 초 단위
         
         if not self.api_key:
             self.logger.error("NewsAPI 키가 설정되지 않았습니다.")
@@ -62,11 +71,23 @@ class NewsAPIParser(TrendParser):
             
         Returns:
             List[Dict[str, Any]]: 파싱된 뉴스 기사 목록
+            
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프 안에서 호출한 경우
         """
         if not self.api_key:
             self.logger.error("NewsAPI 키가 없어 뉴스를 가져올 수 없습니다.")
             return []
         
+        # asyncio.run은 실행 중인 이벤트 루프 안에서 쓸 수 없으므로 빈 결과 대신 바로 오류를 알림
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("get_trends()는 실행 중인 이벤트 루프 안에서 호출할 수 없습니다. "
+                               "비동기 코드에서는 _fetch_all_headlines_async()를 직접 await 하세요.")
+        
         # 성능 측정 시작
         if job_id:
             update_job_status(job_id, "in_progress")
@@ -75,9 +96,11 @@ class NewsAPIParser(TrendParser):
         api_calls = 0  # API 호출 횟수 추적
         
         try:
+            # 카테고리별 요청을 동시에 수행
+            results = asyncio.run(self._fetch_all_headlines_async(self.categories))
+            
             all_articles = []
-            for category in self.categories:
-                category_articles = self._fetch_top_headlines(category)
+            for category, category_articles in zip(self.categories, results):
                 all_articles.extend(category_articles)
                 api_calls += 1
                 self.logger.info(f"{category} 카테고리에서 {len(category_articles)}개 기사 가져옴")
@@ -89,9 +112,11 @@ class NewsAPIParser(TrendParser):
                 # 성능 추적 종료
                 if job_id:
                     end_time = time.time()
-                    track_performance(job_id, "trend_analysis", start_time, end_time)
-                    track_api_usage(job_id, "news", requests_made=api_calls)
-                    update_job_status(job_id, "success")
+                    track_batch(job_id, [
+                        {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                        {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                        {'kind': 'status', 'status': 'success'}
+                    ])
                 return []
             
             # 중복 제거 및 기사 필터링
@@ -105,11 +130,13 @@ class NewsAPIParser(TrendParser):
             # 성능 추적 종료
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "success")
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'success'}
+                ])
             
-            return trending_articles[:self.max_trends]
+            return trending_articles
             
         except Exception as e:
             self.logger.error(f"뉴스 가져오기 중 오류 발생: {str(e)}")
@@ -117,27 +144,71 @@ class NewsAPIParser(TrendParser):
             # 성능 추적 종료 (오류 상태)
             if job_id:
                 end_time = time.time()
-                track_performance(job_id, "trend_analysis", start_time, end_time)
-                track_api_usage(job_id, "news", requests_made=api_calls)
-                update_job_status(job_id, "failed", str(e))
+                track_batch(job_id, [
+                    {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start_time, 'end_time': end_time},
+                    {'kind': 'api_usage', 'api_name': 'news', 'requests_made': api_calls},
+                    {'kind': 'status', 'status': 'failed', 'error_message': str(e)}
+                ])
             
             return []
     
-    def _fetch_top_headlines(self, category: str) -> List[Dict[str, Any]]:
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """
+        요청 묶음 단위로 사용할 비동기 HTTP 클라이언트를 생성합니다.
+        
+        클라이언트는 이벤트 루프에 묶이므로 asyncio.run 호출마다 새로 생성합니다.
+        
+        Returns:
+            httpx.AsyncClient: HTTP/2를 지원하는 비동기 클라이언트
+        """
+        return httpx.AsyncClient(http2=True, limits=self.http_limits, timeout=self.http_timeout)
+    
+    async def _fetch_all_headlines_async(self, categories: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        여러 카테고리의 헤드라인 뉴스를 하나의 세션에서 동시에 가져옵니다.
+        
+        Args:
+            categories (List[str]): 뉴스 카테고리 목록
+            
+        Returns:
+            List[List[Dict[str, Any]]]: 카테고리 순서대로 정렬된 뉴스 기사 목록
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async with self._create_http_client() as session:
+            tasks = [
+                self._fetch_top_headlines_async(session, semaphore, category, delay=index * self.request_interval)
+                for index, category in enumerate(categories)
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        processed_results = []
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"{category} 카테고리 뉴스 가져오기 중 오류 발생: {str(result)}")
+                processed_results.append([])
+            else:
+                processed_results.append(result)
+        
+        return processed_results
+    
+    async def _fetch_top_headlines_async(self, session: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                         category: str, delay: float = 0) -> List[Dict[str, Any]]:
         """
         NewsAPI를 통해 특정 카테고리의 헤드라인 뉴스를 가져옵니다.
         
         Args:
+            session (httpx.AsyncClient): HTTP 클라이언트
+            semaphore (asyncio.Semaphore): 동시 요청 수 제한
             category (str): 뉴스 카테고리
+            delay (float): 요청 시작 전 대기 시간 (초, API 요청 제한 준수)
             
         Returns:
             List[Dict[str, Any]]: 뉴스 기사 목록
         """
-        # API 요청 제한 관리
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < self.request_interval:
-            time.sleep(self.request_interval - elapsed)
+        # API 요청 제한 관리 (요청 시작 시점 분산)
+        if delay:
+            await asyncio.sleep(delay)
         
         params = {
             "apiKey": self.api_key,
@@ -149,8 +220,8 @@ class NewsAPIParser(TrendParser):
         self.logger.debug(f"NewsAPI 호출: 카테고리={category}, 국가={self.country}")
         
         try:
-            response = self.session.get(self.api_url, params=params)
-            self.last_request_time = time.time()
+            async with semaphore:
+                response = await session.get(self.api_url, params=params)
             
             if response.status_code != 200:
                 self.logger.error(f"NewsAPI 오류: {response.status_code} - {response.text}")
@@ -162,6 +233,11 @@ class NewsAPIParser(TrendParser):
                 self.logger.error(f"NewsAPI 응답에 'articles' 필드가 없거나 상태가 ok가 아닙니다: {data}")
                 return []
             
+            # 루프 안에서 반복되는 메서드 조회를 줄이기 위해 지역 변수로 바인딩
+            contains_blacklisted_terms = self._contains_blacklisted_terms
+            extract_publisher_domain = self._extract_publisher_domain
+            extract_keywords = self._extract_keywords
+            
             # 응답 데이터를 표준 형식으로 변환
             processed_articles = []
             for article in data['articles']:
@@ -169,7 +245,7 @@ class NewsAPIParser(TrendParser):
                 description = article.get('description', '')
                 
                 # 블랙리스트 키워드 체크
-                if self._contains_blacklisted_terms(f"{title} {description}"):
+                if contains_blacklisted_terms(f"{title} {description}"):
                     continue
                 
                 # 기사 정보 저장
@@ -181,17 +257,17 @@ class NewsAPIParser(TrendParser):
                     'published_at': article.get('publishedAt', ''),
                     'source': {
                         'name': article.get('source', {}).get('name', ''),
-                        'url': self._extract_publisher_domain(article.get('url', ''))
+                        'url': extract_publisher_domain(article.get('url', ''))
                     },
                     'category': category,
                     'image': article.get('urlToImage', ''),
-                    'keywords': self._extract_keywords(f"{title} {description}")
+                    'keywords': extract_keywords(f"{title} {description}")
                 }
                 processed_articles.append(processed)
             
             return processed_articles
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"NewsAPI 요청 중 오류 발생: {str(e)}")
             return []
     
@@ -200,7 +276,7 @@ class NewsAPIParser(TrendParser):
         if not link:
             return ''
         
-        domain_match = re.search(r'https?://([^/]+)', link)
+        domain_match = _DOMAIN_RE.search(link)
         if not domain_match:
             return ''
         
@@ -217,19 +293,13 @@ class NewsAPIParser(TrendParser):
             List[Dict[str, Any]]: 필터링된 기사 목록
         """
         # URL 기준으로 중복 제거
-        unique_articles = {}
+        # (블랙리스트 필터링은 기사 수집 시 이미 수행됨)
+        seen_urls = set()
+        filtered_articles = []
         for article in articles:
             url = article.get('url', '')
-            if url and url not in unique_articles:
-                unique_articles[url] = article
-        
-        # 블랙리스트 필터링 다시 한번 수행
-        filtered_articles = []
-        for url, article in unique_articles.items():
-            title = article.get('title', '')
-            description = article.get('description', '')
-            
-            if not self._contains_blacklisted_terms(f"{title} {description}"):
+            if url and url not in seen_urls:
+                seen_urls.add(url)
                 filtered_articles.append(article)
         
         return filtered_articles
@@ -244,15 +314,8 @@ class NewsAPIParser(TrendParser):
         Returns:
             List[Dict[str, Any]]: 트렌드 기사 목록
         """
-        # 게시 시간 기준으로 정렬 (최신순)
-        sorted_articles = sorted(
-            articles, 
-            key=lambda x: x.get('published_at', ''),
-            reverse=True
-        )
-        
         # 트렌드 점수 계산 (새로운 필드 추가)
-        for article in sorted_articles:
+        for article in articles:
             # 1. 카테고리 가중치
             category_weight = 1.0
             if article.get('category') in ['technology', 'business']:
@@ -272,14 +335,12 @@ class NewsAPIParser(TrendParser):
             
             article['trend_score'] = min(100, trend_score)
         
-        # 트렌드 점수로 정렬
-        trending_articles = sorted(
-            sorted_articles, 
-            key=lambda x: x.get('trend_score', 0),
-            reverse=True
+        # 트렌드 점수 상위 기사 선택 (동점이면 최신 기사 우선)
+        return heapq.nlargest(
+            self.max_trends,
+            articles,
+            key=lambda x: (x['trend_score'], x.get('published_at', ''))
         )
-        
-        return trending_articles
     
     def _contains_blacklisted_terms(self, text: str) -> bool:
         """
@@ -291,11 +352,7 @@ class NewsAPIParser(TrendParser):
         Returns:
             bool: 블랙리스트 포함 여부
         """
-        if not text:
-            return False
-            
-        text_lower = text.lower()
-        return any(term.lower() in text_lower for term in self.blacklist)
+        return self._blacklist_matcher.contains(text)
 
     def _extract_keywords(self, text: str) -> List[str]:
         """
@@ -307,18 +364,15 @@ class NewsAPIParser(TrendParser):
         Returns:
             List[str]: 추출된 키워드 목록
         """
-        # 특수문자 제거
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # 단어 추출
-        words = text.split()
+        # 단어 추출 (특수문자를 제외한 단어를 한 번에 추출)
+        words = _WORD_RE.findall(text)
         keywords = []
         
         # 키워드 선별 (영어/한국어 구분)
         if self.country == 'kr':
             # 한국어 키워드 (2글자 이상)
             for word in words:
-                if len(word) >= 2 and re.match(r'[\uac00-\ud7a3]+', word):
+                if len(word) >= 2 and '\uac00' <= word[0] <= '\ud7a3':
                     keywords.append(word)
         else:
             # 영어 키워드 (4글자 이상)
@@ -326,6 +380,11 @@ class NewsAPIParser(TrendParser):
                 if len(word) > 3:
                     keywords.append(word.lower())
         
-        # 중복 제거 및 상위 10개 반환
-        unique_keywords = list(set(keywords))
-        return unique_keywords[:10]
+        # 중복 제거 및 상위 10개 반환 (등장 순서 유지)
+        unique_keywords = {}
+        for keyword in keywords:
+            if keyword not in unique_keywords:
+                unique_keywords[keyword] = None
+                if len(unique_keywords) == 10:
+                    break
+        return list(unique_keywords)
@@ -6,12 +6,35 @@
 """
 
 import os
+import copy
+import functools
 import yaml
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+# libyaml이 설치되어 있으면 C 기반 로더 사용
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    YAML 설정 파일을 파싱합니다. (경로와 수정 시각 기준으로 캐시)
+    
+    Args:
+        config_path (str): 설정 파일 절대 경로
+        mtime (float): 설정 파일 수정 시각 (파일이 바뀌면 캐시가 자동으로 무효화됨)
+        
+    Returns:
+        Dict[str, Any]: 파싱된 설정 객체
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 class ConfigLoader:
     """설정 파일 및 시크릿 로딩 클래스"""
     
@@ -34,10 +57,10 @@ class ConfigLoader:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
         
-        # 기본 설정 로드
+        # 기본 설정 로드 (파싱 결과는 캐시를 공유하므로 복사본에 시크릿을 병합)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config_path = os.path.abspath(config_path)
+            config = copy.deepcopy(_load_yaml_cached(config_path, os.path.getmtime(config_path)))
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"YAML 파싱 오류 (설정 파일): {str(e)}")
         
@@ -6,10 +6,17 @@
 """
 
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Optional
 
+# 테스트 스크립트 등에서 공유하는 기본 로그 포맷
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FORMATTER = logging.Formatter(LOG_FORMAT)
+
 
 def setup_logger(log_level: str = 'INFO', log_dir: Optional[str] = None) -> logging.Logger:
     """
@@ -44,10 +51,7 @@ def setup_logger(log_level: str = 'INFO', log_dir: Optional[str] = None) -> logg
     console_handler.setLevel(level)
     
     # 포맷터
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = logging.Formatter(LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
@@ -64,6 +68,15 @@ def setup_logger(log_level: str = 'INFO', log_dir: Optional[str] = None) -> logg
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # 파일 쓰기는 백그라운드 스레드에서 처리 (로깅 호출은 큐에 넣기만 함)
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        logger.addHandler(queue_handler)
     
     return logger
\ No newline at end of file
@@ -1,10 +1,21 @@
 import os
 import json
+import logging
 import time
+import atexit
+import functools
+import threading
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('autoblog.metadata')
+
 # 지원하는 LLM 서비스 목록
-SUPPORTED_LLM_SERVICES = ['openai', 'anthropic', 'google', 'cohere', 'mistral', 'custom']
+SUPPORTED_LLM_SERVICES = frozenset({'openai', 'anthropic', 'google', 'cohere', 'mistral', 'custom'})
 
 # LLM 서비스별 비용 계수 (1000 토큰당 USD 기준, 예상치)
 LLM_COST_FACTORS = {
@@ -16,59 +27,241 @@ LLM_COST_FACTORS = {
     'custom': 0.001  # 기본값
 }
 
+# LLM 서비스별 메타데이터 키 (토큰, 요청, 비용, 모델)
+_UPDATE_KEYS = {
+    service: (f'{service}_tokens', f'{service}_requests', f'{service}_cost', f'{service}_model')
+    for service in SUPPORTED_LLM_SERVICES
+}
+
+# 메타데이터 파일 쓰기 지연 시간 (초) - 첫 업데이트 후 이 시간이 지난 다음 호출에서 한 번에 저장
+FLUSH_DELAY = 0.5
+
+# 작업이 끝난 것으로 보고 즉시 파일에 저장하는 상태
+TERMINAL_STATUSES = frozenset({'success', 'failed'})
+
+# 작업별로 아직 파일에 저장되지 않은 메타데이터 업데이트
+_cache = {}
+# 작업별로 아직 업데이트에 반영되지 않은 성능 측정 기록 (operation, duration, time_ns)
+_perf_events = {}
+# 파일에 저장해야 하는 작업 ID
+_dirty = set()
+# 작업별로 저장되지 않은 첫 업데이트 시각 (time.monotonic())
+_pending_since = {}
+_lock = threading.RLock()
+# 이미 생성을 확인한 메타데이터 디렉토리
+_ensured_dirs = set()
+
+class _NsTimestamp(int):
+    """time.time_ns() 값을 담는 타임스탬프. 파일에 저장할 때 ISO 8601 문자열로 변환됩니다."""
+    
+    __slots__ = ()
+    
+    def isoformat(self):
+        """로컬 시간 기준 ISO 8601 문자열로 변환"""
+        seconds, nanos = divmod(int(self), 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+def _now_ns():
+    """현재 시간을 _NsTimestamp로 반환"""
+    return _NsTimestamp(time.time_ns())
+
+def _loads(data):
+    """JSON 바이트를 파싱합니다. (orjson이 없으면 json 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(metadata):
+    """메타데이터를 공백 없는 한 줄 JSON 바이트로 직렬화합니다. (orjson이 없으면 json 사용)"""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+@functools.lru_cache(maxsize=4096)
+def _metadata_path(job_id):
+    """작업 ID에 해당하는 메타데이터 파일 경로 (job_id별로 캐시)"""
+    return os.path.join('data', 'metadata', f'job_{job_id}.json')
+
+def _write_job_metadata(job_id, metadata_updates):
+    """
+    모인 업데이트를 작업 메타데이터 파일에 반영합니다.
+    
+    다른 모듈(JsonFileStorage 등)이 같은 파일을 수정할 수 있으므로
+    저장 시점의 파일을 다시 읽어 업데이트만 병합합니다.
+    
+    Args:
+        job_id (str): 작업 ID
+        metadata_updates (dict): 반영할 메타데이터 정보
+    """
+    metadata_path = _metadata_path(job_id)
+    
+    # 기존 메타데이터 읽기
+    if os.path.exists(metadata_path):
+        with open(metadata_path, 'rb') as f:
+            metadata = _loads(f.read())
+    else:
+        metadata = {
+            'job_id': job_id,
+            'timestamp': datetime.now().isoformat(),
+            'status': 'unknown'
+        }
+    
+    # 모니터링 정보 업데이트 (대기 중에 정수로 보관한 타임스탬프는 여기서 문자열로 변환)
+    for key, value in metadata_updates.items():
+        metadata[key] = value.isoformat() if type(value) is _NsTimestamp else value
+    
+    # 메타데이터 저장 (임시 파일에 쓴 뒤 교체하여 잘린 파일이 남지 않도록 함)
+    metadata_dir = os.path.dirname(metadata_path)
+    if metadata_dir not in _ensured_dirs:
+        os.makedirs(metadata_dir, exist_ok=True)
+        _ensured_dirs.add(metadata_dir)
+    
+    tmp_path = metadata_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_dumps(metadata))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, metadata_path)
+
+def _pending_updates_locked(job_id):
+    """
+    작업의 대기 중인 업데이트를 반환합니다. (_lock을 잡은 상태에서 호출)
+    
+    버퍼에 쌓인 성능 측정 기록은 기록된 순서대로 업데이트에 반영됩니다.
+    
+    Args:
+        job_id (str): 작업 ID
+    
+    Returns:
+        dict: 대기 중인 메타데이터 업데이트
+    """
+    pending = _cache.setdefault(job_id, {})
+    
+    events = _perf_events.pop(job_id, None)
+    if events:
+        for operation, duration, timestamp_ns in events:
+            timestamp = _NsTimestamp(timestamp_ns)
+            pending[f'{operation}_time'] = duration
+            pending[f'{operation}_timestamp'] = timestamp
+            pending['updated_at'] = timestamp
+    
+    return pending
+
+def _mark_dirty_locked(job_id):
+    """
+    작업을 저장 대상으로 표시합니다. (_lock을 잡은 상태에서 호출)
+    
+    JsonFileStorage가 같은 파일을 별도 동기화 없이 쓰기 때문에 백그라운드 스레드에서
+    저장하지 않고, 첫 업데이트 후 FLUSH_DELAY가 지났으면 호출한 스레드에서 바로 저장합니다.
+    
+    Args:
+        job_id (str): 작업 ID
+    
+    Returns:
+        bool: 성공 여부 (저장하지 않은 경우 True)
+    """
+    _dirty.add(job_id)
+    
+    pending_since = _pending_since.setdefault(job_id, time.monotonic())
+    if time.monotonic() - pending_since >= FLUSH_DELAY:
+        return _flush_locked(job_id)
+    
+    return True
+
 def update_job_metadata(job_id, metadata_updates):
     """
     작업 메타데이터에 모니터링 정보를 추가하는 함수
     
+    업데이트는 메모리에 모아 두었다가 첫 업데이트 후 FLUSH_DELAY가 지난 다음 호출,
+    종료 상태 기록 시, 또는 프로세스 종료 시 한 번에 파일에 저장됩니다.
+    즉시 저장이 필요하면 flush()를 호출합니다.
+    
     Args:
         job_id (str): 업데이트할 작업의, ID
         metadata_updates (dict): 추가할 메타데이터 정보
     
     Returns:
-        bool: 성공 여부
+        bool: 성공 여부 (이번 호출에서 저장이 일어난 경우 저장 성공 여부, 아니면 True)
     """
-    try:
-        metadata_path = os.path.join('data', 'metadata', f'job_{job_id}.json')
-        
-        # 기존 메타데이터 읽기
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-        else:
-            metadata = {
-                'job_id': job_id,
-                'timestamp': datetime.now().isoformat(),
-                'status': 'unknown'
-            }
-        
-        # 모니터링 정보 업데이트
-        metadata.update(metadata_updates)
+    with _lock:
+        pending = _pending_updates_locked(job_id)
+        pending.update(metadata_updates)
         
         # 타임스탬프 업데이트
         if 'updated_at' not in metadata_updates:
-            metadata['updated_at'] = datetime.now().isoformat()
+            pending['updated_at'] = _now_ns()
         
-        # 메타데이터 저장
-        os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-            
+        return _mark_dirty_locked(job_id)
+
+def _flush_locked(job_id):
+    """
+    작업의 대기 중인 업데이트를 파일에 저장합니다. (_lock을 잡은 상태에서 호출)
+    
+    Args:
+        job_id (str): 작업 ID
+    
+    Returns:
+        bool: 성공 여부
+    """
+    if job_id not in _dirty:
         return True
     
-    except Exception as e:
-        print(f"메타데이터 업데이트 중 오류: {e}")
+    metadata_updates = _pending_updates_locked(job_id)
+    
+    try:
+        _write_job_metadata(job_id, metadata_updates)
+    except Exception:
+        # 업데이트는 대기열에 그대로 두고 다음 저장 때 다시 시도
+        logger.exception("메타데이터 업데이트 중 오류: job_id=%s", job_id)
         return False
+    
+    _dirty.discard(job_id)
+    _cache.pop(job_id, None)
+    _pending_since.pop(job_id, None)
+    return True
 
-def track_llm_usage(job_id, service_name, tokens_used=0, requests_made=1, model_name=None):
+def flush(job_id):
     """
-    LLM API 사용량을 추적하여 메타데이터에 저장
+    작업에 대해 모인 메타데이터 업데이트를 즉시 파일에 저장합니다.
     
     Args:
         job_id (str): 작업 ID
+    
+    Returns:
+        bool: 성공 여부
+    """
+    with _lock:
+        return _flush_locked(job_id)
+
+def flush_all():
+    """
+    저장되지 않은 모든 작업 메타데이터를 파일에 저장합니다. (프로세스 종료 시 자동 호출)
+    
+    락을 한 번만 잡고 모든 작업을 저장하며, 한 작업의 저장 실패가
+    다른 작업의 저장을 막지 않습니다.
+    
+    Returns:
+        bool: 모든 저장의 성공 여부
+    """
+    with _lock:
+        results = [_flush_locked(job_id) for job_id in list(_dirty)]
+    
+    return all(results)
+
+atexit.register(flush_all)
+
+def _build_llm_usage_updates(service_name, tokens_used=0, requests_made=1, model_name=None):
+    """
+    LLM API 사용량 메타데이터 업데이트를 생성
+    
+    Args:
         service_name (str): LLM 서비스 이름 (예: 'openai', 'anthropic', 'google')
         tokens_used (int): 사용된 토큰 수
         requests_made (int): API 요청 횟수
         model_name (str, optional): 사용된 모델 이름 (예: 'gpt-3.5-turbo', 'claude-2')
+    
+    Returns:
+        dict: 메타데이터 업데이트
     """
     # 서비스 이름 정규화
     service_name = service_name.lower()
@@ -78,21 +271,107 @@ def track_llm_usage(job_id, service_name, tokens_used=0, requests_made=1, model_
         service_name = 'custom'
     
     # 비용 계산
-    cost_factor = LLM_COST_FACTORS.get(service_name, 0.001)
+    cost_factor = LLM_COST_FACTORS[service_name]
     cost = (tokens_used / 1000) * cost_factor
     
+    tokens_key, requests_key, cost_key, model_key = _UPDATE_KEYS[service_name]
     updates = {
         'llm_service': service_name,
-        f'{service_name}_tokens': tokens_used,
-        f'{service_name}_requests': requests_made,
-        f'{service_name}_cost': cost
+        tokens_key: tokens_used,
+        requests_key: requests_made,
+        cost_key: cost
     }
     
     # 모델 이름이 제공된 경우 추가
     if model_name:
-        updates[f'{service_name}_model'] = model_name
+        updates[model_key] = model_name
+    
+    return updates
+
+def _build_api_usage_updates(api_name, tokens_used=0, requests_made=0):
+    """
+    API 사용량 메타데이터 업데이트를 생성
+    
+    Args:
+        api_name (str): API 이름 (예: 'openai', 'news')
+        tokens_used (int): 사용된 토큰 수 (OpenAI API 등)
+        requests_made (int): 요청 횟수
+    
+    Returns:
+        dict: 메타데이터 업데이트
+    """
+    api_name = api_name.lower()
+    
+    if api_name in SUPPORTED_LLM_SERVICES:
+        return _build_llm_usage_updates(api_name, tokens_used, requests_made)
+    elif api_name == 'news':
+        return {'news_api_requests': requests_made}
+    else:
+        # 기타 API는 필요시 추가
+        return {f'{api_name}_requests': requests_made}
+
+def _build_performance_updates(operation, start_time=None, end_time=None, duration=None):
+    """
+    작업 성능 메타데이터 업데이트를 생성
+    
+    Args:
+        operation (str): 작업 유형 (예: 'content_generation', 'publishing')
+        start_time (float, optional): 시작 시간 (time.time() 값)
+        end_time (float, optional): 종료 시간 (time.time() 값)
+        duration (float, optional): 직접 계산된 소요 시간 (초)
     
-    update_job_metadata(job_id, updates)
+    Returns:
+        dict: 메타데이터 업데이트 (소요 시간을 알 수 없으면 빈 dict)
+    """
+    if duration is None and start_time is not None and end_time is not None:
+        duration = end_time - start_time
+    
+    if duration is None:
+        return {}
+    
+    return {
+        f'{operation}_time': duration,
+        f'{operation}_timestamp': _now_ns()
+    }
+
+def _build_status_updates(status, error_message=None):
+    """
+    작업 상태 메타데이터 업데이트를 생성
+    
+    Args:
+        status (str): 작업 상태 ('pending', 'in_progress', 'success', 'failed')
+        error_message (str, optional): 오류 메시지 (상태가 'failed'인 경우)
+    
+    Returns:
+        dict: 메타데이터 업데이트
+    """
+    updates = {'status': status}
+    
+    if status == 'failed' and error_message:
+        updates['error'] = error_message
+    
+    return updates
+
+# track_batch 이벤트 종류별 업데이트 생성 함수
+_UPDATE_BUILDERS = {
+    'llm_usage': _build_llm_usage_updates,
+    'api_usage': _build_api_usage_updates,
+    'performance': _build_performance_updates,
+    'status': _build_status_updates
+}
+
+def track_llm_usage(job_id, service_name, tokens_used=0, requests_made=1, model_name=None):
+    """
+    LLM API 사용량을 추적하여 메타데이터에 저장
+    
+    Args:
+        job_id (str): 작업 ID
+        service_name (str): LLM 서비스 이름 (예: 'openai', 'anthropic', 'google')
+        tokens_used (int): 사용된 토큰 수
+        requests_made (int): API 요청 횟수
+        model_name (str, optional): 사용된 모델 이름 (예: 'gpt-3.5-turbo', 'claude-2')
+    """
+    update_job_metadata(job_id, _build_llm_usage_updates(service_name, tokens_used, requests_made, model_name))
 
 def track_api_usage(job_id, api_name, tokens_used=0, requests_made=0):
     """
@@ -104,22 +383,15 @@ def track_api_usage(job_id, api_name, tokens_used=0, requests_made=0):
         tokens_used (int): 사용된 토큰 수 (OpenAI API 등)
         requests_made (int): 요청 횟수
     """
-    if api_name.lower() == 'openai':
-        track_llm_usage(job_id, 'openai', tokens_used, requests_made)
-    elif api_name.lower() in SUPPORTED_LLM_SERVICES:
-        track_llm_usage(job_id, api_name.lower(), tokens_used, requests_made)
-    elif api_name.lower() == 'news':
-        updates = {'news_api_requests': requests_made}
-        update_job_metadata(job_id, updates)
-    else:
-        # 기타 API는 필요시 추가
-        updates = {f'{api_name.lower()}_requests': requests_made}
-        update_job_metadata(job_id, updates)
+    update_job_metadata(job_id, _build_api_usage_updates(api_name, tokens_used, requests_made))
 
 def track_performance(job_id, operation, start_time=None, end_time=None, duration=None):
     """
     작업 성능 정보를 추적하여 메타데이터에 저장
     
+    측정 기록은 작업별 버퍼에 추가만 하고, 다음 업데이트나 저장 시점에
+    한꺼번에 메타데이터로 변환됩니다.
+    
     Args:
         job_id (str): 작업 ID
         operation (str): 작업 유형 (예: 'content_generation', 'publishing')
@@ -130,12 +402,12 @@ def track_performance(job_id, operation, start_time=None, end_time=None, duratio
     if duration is None and start_time is not None and end_time is not None:
         duration = end_time - start_time
     
-    if duration is not None:
-        updates = {
-            f'{operation}_time': duration,
-            f'{operation}_timestamp': datetime.now().isoformat()
-        }
-        update_job_metadata(job_id, updates)
+    if duration is None:
+        return
+    
+    with _lock:
+        _perf_events.setdefault(job_id, []).append((operation, duration, time.time_ns()))
+        _mark_dirty_locked(job_id)
 
 def update_job_status(job_id, status, error_message=None):
     """
@@ -146,9 +418,44 @@ def update_job_status(job_id, status, error_message=None):
         status (str): 작업 상태 ('pending', 'in_progress', 'success', 'failed')
         error_message (str, optional): 오류 메시지 (상태가 'failed'인 경우)
     """
-    updates = {'status': status}
+    update_job_metadata(job_id, _build_status_updates(status, error_message))
     
-    if status == 'failed' and error_message:
-        updates['error'] = error_message
+    # 작업이 끝나면 모인 업데이트를 바로 저장
+    if status in TERMINAL_STATUSES:
+        flush(job_id)
+
+def track_batch(job_id, events):
+    """
+    여러 추적 이벤트를 하나의 메타데이터 업데이트로 모아 저장
+    
+    각 이벤트는 'kind'('llm_usage', 'api_usage', 'performance', 'status')와
+    해당 track_* 함수의 인자(job_id 제외)를 담은 dict입니다.
+    
+    예:
+        track_batch(job_id, [
+            {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': start, 'end_time': end},
+            {'kind': 'api_usage', 'api_name': 'news', 'requests_made': 3},
+            {'kind': 'status', 'status': 'success'}
+        ])
+    
+    Args:
+        job_id (str): 작업 ID
+        events (list): 추적 이벤트 목록 (나중 이벤트가 같은 키를 덮어씀)
+    """
+    updates = {}
+    terminal = False
+    
+    for event in events:
+        params = dict(event)
+        kind = params.pop('kind')
+        updates.update(_UPDATE_BUILDERS[kind](**params))
+        
+        if kind == 'status' and params.get('status') in TERMINAL_STATUSES:
+            terminal = True
+    
+    if updates:
+        update_job_metadata(job_id, updates)
     
-    update_job_metadata(job_id, updates) 
\ No newline at end of file
+    # 작업이 끝나면 모인 업데이트를 바로 저장
+    if terminal:
+        flush(job_id)
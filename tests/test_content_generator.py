@@ -15,6 +15,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils.config import ConfigLoader
+from src.utils.logger import LOG_FORMATTER
 from src.trends.parsers.gnews_parser import GNewsParser
 from src.trends.analyzers.trend_analyzer import GNewsTrendAnalyzer
 from src.content.generators.openai import OpenAIContentGenerator
@@ -24,16 +25,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 def setup_logging():
-    """로깅 설정을 초기화합니다."""
+    """로깅 설정을 초기화합니다. (이미 설정된 경우 핸들러를 다시 추가하지 않음)"""
+    # 루트 로거 설정
+    logger = logging.getLogger()
+    if getattr(logger, '_autoblog_configured', False):
+        return logger
+    logger._autoblog_configured = True
+    logger.setLevel(logging.INFO)
+    
     log_dir = os.path.join(os.path.dirname(__file__), 'logs')
     os.makedirs(log_dir, exist_ok=True)
     
     log_file = os.path.join(log_dir, f'content_generator_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
     
-    # 루트 로거 설정
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    
     # 파일 핸들러
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.INFO)
@@ -42,10 +46,9 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     
-    # 포맷 설정
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    # 포맷 설정 (공유 포맷터 사용)
+    file_handler.setFormatter(LOG_FORMATTER)
+    console_handler.setFormatter(LOG_FORMATTER)
     
     # 핸들러 추가
     logger.addHandler(file_handler)
@@ -61,8 +64,8 @@ def save_content(content, output_dir='../test_data/contents'):
     
     # JSON 파일로 저장
     json_file = os.path.join(output_dir, f'content_{timestamp}.json')
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(content, f, ensure_ascii=False, indent=2)
+    with open(json_file, 'wb') as f:
+        f.write(json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
     
     # 마크다운 파일로 저장
     md_file = os.path.join(output_dir, f'content_{timestamp}.md')
@@ -89,7 +92,7 @@ def main():
         logger.info("1. 뉴스 기사 수집 시작")
         parser = GNewsParser(config)
         articles = parser.get_trends()
-        logger.info(f"   {len(articles)}개 뉴스 기사 수집 완료")
+        logger.info("   %d개 뉴스 기사 수집 완료", len(articles))
         
         if not articles:
             logger.error("수집된 뉴스 기사가 없습니다. 프로세스를 종료합니다.")
@@ -99,7 +102,7 @@ def main():
         logger.info("2. 뉴스 기사 분석 시작")
         analyzer = GNewsTrendAnalyzer(config)
         analyzed_articles = analyzer.analyze_trends(articles)
-        logger.info(f"   {len(analyzed_articles)}개 뉴스 기사 분석 완료")
+        logger.info("   %d개 뉴스 기사 분석 완료", len(analyzed_articles))
         
         if not analyzed_articles:
             logger.error("분석된 뉴스 기사가 없습니다. 프로세스를 종료합니다.")
@@ -107,7 +110,7 @@ def main():
         
         # 상위 기사 선택
         test_article = analyzed_articles[0]
-        logger.info(f"테스트 기사: '{test_article['title']}'")
+        logger.info("테스트 기사: '%s'", test_article['title'])
         
         # 3. 콘텐츠 생성기 초기화
         logger.info("3. 콘텐츠 생성기 초기화")
@@ -116,7 +119,7 @@ def main():
         
         # 비용 추정
         estimated_cost = generator.estimate_cost(test_article)
-        logger.info(f"   예상 비용: ${estimated_cost:.4f}")
+        logger.info("   예상 비용: $%.4f", estimated_cost)
         
         # 4. 콘텐츠 생성
         logger.info("4. 콘텐츠 생성 시작")
@@ -135,12 +138,12 @@ def main():
         
         # 5. 콘텐츠 저장
         json_file, md_file = save_content(content)
-        logger.info(f"5. 생성된 콘텐츠 저장 완료: {json_file}, {md_file}")
+        logger.info("5. 생성된 콘텐츠 저장 완료: %s, %s", json_file, md_file)
         
         logger.info("=== 콘텐츠 생성기 테스트 완료 ===")
     
     except Exception as e:
-        logger.exception(f"오류 발생: {str(e)}")
+        logger.exception("오류 발생: %s", e)
         return
 
 if __name__ == "__main__":
@@ -17,27 +17,33 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 # 설정 로더 임포트
 from src.utils.config import ConfigLoader
+from src.utils.logger import LOG_FORMATTER
 
 # Docusaurus 포맷터 임포트
 from src.content.formatters.docusaurus import DocusaurusFormatter
 
 def setup_logging():
-    """로깅 설정을 초기화합니다."""
+    """로깅 설정을 초기화합니다. (이미 설정된 경우 핸들러를 다시 추가하지 않음)"""
+    logger = logging.getLogger()
+    if getattr(logger, '_autoblog_configured', False):
+        return logger
+    logger._autoblog_configured = True
+    
     # 로그 디렉토리 생성
     os.makedirs('logs', exist_ok=True)
     
-    # 로거 설정
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # 로거 설정 (공유 포맷터 사용)
+    file_handler = logging.FileHandler(f'logs/formatter_test_{datetime.now().strftime("%Y%m%d")}.log')
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(LOG_FORMATTER)
+    console_handler.setFormatter(LOG_FORMATTER)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format=log_format,
-        handlers=[
-            logging.FileHandler(f'logs/formatter_test_{datetime.now().strftime("%Y%m%d")}.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[file_handler, console_handler]
     )
     
-    return logging.getLogger()
+    return logger
 
 def save_formatted_content(content: str, output_dir='../test_data/formatted'):
     """포맷팅된 콘텐츠를 파일로 저장합니다."""
@@ -53,8 +59,8 @@ def save_formatted_content(content: str, output_dir='../test_data/formatted'):
 
 def load_sample_content(file_path: str) -> Dict[str, Any]:
     """샘플 콘텐츠를 JSON 파일에서 로드합니다."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read())
 
 def main():
     """Docusaurus 포맷터 테스트 스크립트의 메인 함수"""
@@ -72,10 +78,10 @@ def main():
         content_dir = '../test_data/contents'
         
         if not os.path.exists(content_dir) or not os.listdir(content_dir):
-            logger.error(f"콘텐츠 디렉토리가 비어있거나 존재하지 않습니다: {content_dir}")
+            logger.error("콘텐츠 디렉토리가 비어있거나 존재하지 않습니다: %s", content_dir)
             # 테스트 디렉토리 생성
             os.makedirs(content_dir, exist_ok=True)
-            logger.info(f"테스트 디렉토리 생성: {content_dir}")
+            logger.info("테스트 디렉토리 생성: %s", content_dir)
             
             # 샘플 콘텐츠 생성
             logger.info("샘플 콘텐츠 생성")
@@ -94,27 +100,32 @@ def main():
             
             # 샘플 콘텐츠 저장
             sample_file_path = os.path.join(content_dir, f"sample_content_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            with open(sample_file_path, 'w', encoding='utf-8') as f:
-                json.dump(sample_content, f, ensure_ascii=False, indent=2)
+            with open(sample_file_path, 'wb') as f:
+                f.write(json.dumps(sample_content, ensure_ascii=False, indent=2).encode('utf-8'))
                 
-            logger.info(f"샘플 콘텐츠 저장 완료: {sample_file_path}")
+            logger.info("샘플 콘텐츠 저장 완료: %s", sample_file_path)
             latest_file_path = sample_file_path
         else:
-            # 최신 JSON 파일 찾기
-            json_files = [f for f in os.listdir(content_dir) if f.endswith('.json')]
-            if not json_files:
+            # 최신 JSON 파일 찾기 (scandir 한 번으로 이름 필터링 후 JSON 파일만 stat)
+            with os.scandir(content_dir) as entries:
+                latest_entry = max(
+                    (entry for entry in entries if entry.name.endswith('.json')),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+            
+            if latest_entry is None:
                 logger.error("JSON 파일을 찾을 수 없습니다.")
                 return
             
-            latest_file = max(json_files, key=lambda x: os.path.getmtime(os.path.join(content_dir, x)))
-            latest_file_path = os.path.join(content_dir, latest_file)
+            latest_file_path = latest_entry.path
             
-        logger.info(f"최신 콘텐츠 파일: {latest_file_path}")
+        logger.info("최신 콘텐츠 파일: %s", latest_file_path)
         
         # 2. 콘텐츠 로드
         logger.info("2. 콘텐츠 로드")
         content = load_sample_content(latest_file_path)
-        logger.info(f"콘텐츠 로드 완료: '{content.get('title', '제목 없음')}'")
+        logger.info("콘텐츠 로드 완료: '%s'", content.get('title', '제목 없음'))
         
         # 3. Docusaurus 포맷터 초기화
         logger.info("3. Docusaurus 포맷터 초기화")
@@ -130,7 +141,7 @@ def main():
         
         # 포맷팅된 콘텐츠 저장
         blog_file = save_formatted_content(formatted_blog, '../test_data/formatted')
-        logger.info(f"포맷팅된 Docusaurus 블로그 콘텐츠 저장 완료: {blog_file}")
+        logger.info("포맷팅된 Docusaurus 블로그 콘텐츠 저장 완료: %s", blog_file)
         
         # 콘솔에 결과 출력
         print("\n=== 포맷팅된 Docusaurus 콘텐츠 ===")
@@ -140,12 +151,12 @@ def main():
         logger.info("5. 기본 포맷팅 테스트")
         default_formatted = formatter._default_format(content)
         default_file = save_formatted_content(default_formatted, '../test_data/formatted')
-        logger.info(f"기본 Docusaurus 포맷팅 완료: {default_file}")
+        logger.info("기본 Docusaurus 포맷팅 완료: %s", default_file)
         
         logger.info("=== Docusaurus 포맷터 테스트 완료 ===")
         
     except Exception as e:
-        logger.exception(f"오류 발생: {str(e)}")
+        logger.exception("오류 발생: %s", e)
         return
 
 if __name__ == "__main__":
@@ -217,7 +217,7 @@ def manual_test():
         try:
             authors_path = f"{config['publishing']['docusaurus']['blog_path']}/authors.yml"
             publisher._repo.get_contents(authors_path, ref=publisher.branch)
-            logger.info(f"authors.yml 파일이 이미 존재합니다")
+            logger.info("authors.yml 파일이 이미 존재합니다")
         except GithubException as e:
             if e.status == 404:  # 파일이 없음
                 authors_content = """# blog/authors.yml 파일
@@ -235,11 +235,11 @@ autoblog:
                     "Add authors.yml for blog posts"
                 )
                 if result['status'] == 'success':
-                    logger.info(f"authors.yml 파일 생성 완료: {result['github_url']}")
+                    logger.info("authors.yml 파일 생성 완료: %s", result['github_url'])
                 else:
-                    logger.error(f"authors.yml 파일 생성 실패: {result.get('error')}")
+                    logger.error("authors.yml 파일 생성 실패: %s", result.get('error'))
             else:
-                logger.error(f"authors.yml 파일 확인 중 오류: {str(e)}")
+                logger.error("authors.yml 파일 확인 중 오류: %s", e)
         
         # 테스트용 콘텐츠 준비
         test_slug = f"test-post-{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -265,21 +265,21 @@ tags: [test, automation]
         }
         
         # 게시 테스트
-        logger.info(f"콘텐츠 게시 시도: {test_content['title']}")
+        logger.info("콘텐츠 게시 시도: %s", test_content['title'])
         result = publisher.publish(test_content)
         
         if result['status'] == 'success':
-            logger.info(f"게시 성공: {result['url']}")
+            logger.info("게시 성공: %s", result['url'])
             print(f"\n게시 성공: {result['url']}")
             print(f"파일 경로: {result['path']}")
         else:
-            logger.error(f"게시 실패: {result.get('error', '알 수 없는 오류')}")
+            logger.error("게시 실패: %s", result.get('error', '알 수 없는 오류'))
             print(f"\n게시 실패: {result.get('error', '알 수 없는 오류')}")
         
         logger.info("=== Docusaurus 퍼블리셔 수동 테스트 완료 ===")
         
     except Exception as e:
-        logger.exception(f"오류 발생: {str(e)}")
+        logger.exception("오류 발생: %s", e)
 
 if __name__ == "__main__":
     # 명령행 인수에 따라 자동 테스트 또는 수동 테스트 실행
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메타데이터 추적 모듈에 대한 유닛 테스트
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.storage.json_storage import JsonFileStorage
+from src.utils import metadata_enhancer
+
+# 실행 시점에 따라 값이 달라지는 키 (파일 비교 시 제외)
+_TIME_KEYS = frozenset({'timestamp', 'updated_at', 'trend_analysis_timestamp'})
+
+
+class TestMetadataEnhancer(unittest.TestCase):
+    """metadata_enhancer 테스트 클래스"""
+
+    def setUp(self):
+        """임시 작업 디렉토리에서 빈 대기열로 시작"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        cwd = os.getcwd()
+        os.chdir(tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self._reset_state()
+        self.addCleanup(self._reset_state)
+
+        self.storage = JsonFileStorage('data')
+
+    def _reset_state(self):
+        """모듈 전역 대기열 초기화"""
+        metadata_enhancer._cache.clear()
+        metadata_enhancer._perf_events.clear()
+        metadata_enhancer._dirty.clear()
+        metadata_enhancer._pending_since.clear()
+        metadata_enhancer._ensured_dirs.clear()
+
+    def _read(self, job_id):
+        """작업 메타데이터 파일을 읽어 반환"""
+        with open(os.path.join('data', 'metadata', f'job_{job_id}.json'), encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_pending_updates_merge_over_storage_writes(self):
+        """대기 중인 업데이트는 그 사이 JsonFileStorage가 쓴 키를 지우지 않아야 함"""
+        self.storage.save_data({'job_id': 'job1', 'status': 'in_progress'}, 'metadata/job_{job_id}.json', job_id='job1')
+
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=3)
+        metadata_enhancer.track_performance('job1', 'analysis', duration=1.5)
+        self.storage.update_metadata('job1', 'files.raw', 'raw.json')
+
+        # FLUSH_DELAY 전에는 파일에 반영되지 않음
+        self.assertNotIn('news_api_requests', self._read('job1'))
+        self.assertIn('job1', metadata_enhancer._dirty)
+
+        self.assertTrue(metadata_enhancer.flush('job1'))
+
+        metadata = self._read('job1')
+        self.assertEqual(metadata['files'], {'raw': 'raw.json'})
+        self.assertEqual(metadata['news_api_requests'], 3)
+        self.assertEqual(metadata['analysis_time'], 1.5)
+        self.assertEqual(metadata['status'], 'in_progress')
+        self.assertNotIn('job1', metadata_enhancer._cache)
+        self.assertNotIn('job1', metadata_enhancer._perf_events)
+
+    def test_flush_after_delay_on_next_call(self):
+        """FLUSH_DELAY가 지난 뒤의 호출은 호출한 스레드에서 바로 저장해야 함"""
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=1)
+        self.assertFalse(os.path.exists(os.path.join('data', 'metadata', 'job_job1.json')))
+
+        metadata_enhancer._pending_since['job1'] -= metadata_enhancer.FLUSH_DELAY
+        metadata_enhancer.track_performance('job1', 'analysis', duration=0.5)
+
+        metadata = self._read('job1')
+        self.assertEqual(metadata['news_api_requests'], 1)
+        self.assertEqual(metadata['analysis_time'], 0.5)
+        self.assertNotIn('job1', metadata_enhancer._dirty)
+        self.assertNotIn('job1', metadata_enhancer._pending_since)
+
+    def test_terminal_status_flushes_immediately(self):
+        """종료 상태는 FLUSH_DELAY를 기다리지 않고 바로 저장해야 함"""
+        metadata_enhancer.update_job_status('job1', 'in_progress')
+        self.assertIn('job1', metadata_enhancer._dirty)
+
+        metadata_enhancer.update_job_status('job1', 'failed', error_message='timeout')
+
+        metadata = self._read('job1')
+        self.assertEqual(metadata['status'], 'failed')
+        self.assertEqual(metadata['error'], 'timeout')
+        self.assertNotIn('job1', metadata_enhancer._dirty)
+
+    def test_failed_write_keeps_updates_queued(self):
+        """저장에 실패하면 업데이트가 대기열에 남아 다음 저장 때 반영되어야 함"""
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=2)
+        metadata_enhancer.track_performance('job1', 'analysis', duration=2.0)
+
+        with patch.object(metadata_enhancer, '_write_job_metadata', side_effect=OSError('disk full')):
+            with self.assertLogs('autoblog.metadata', level='ERROR'):
+                self.assertFalse(metadata_enhancer.flush('job1'))
+
+        self.assertIn('job1', metadata_enhancer._dirty)
+        self.assertEqual(metadata_enhancer._cache['job1']['news_api_requests'], 2)
+        self.assertEqual(metadata_enhancer._cache['job1']['analysis_time'], 2.0)
+
+        self.assertTrue(metadata_enhancer.flush('job1'))
+
+        metadata = self._read('job1')
+        self.assertEqual(metadata['news_api_requests'], 2)
+        self.assertEqual(metadata['analysis_time'], 2.0)
+        self.assertNotIn('job1', metadata_enhancer._dirty)
+
+    def test_failed_replace_keeps_previous_file(self):
+        """임시 파일 교체에 실패하면 기존 파일이 그대로 남아야 함"""
+        metadata_enhancer.update_job_status('job1', 'success')
+        before = self._read('job1')
+
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=5)
+        with patch.object(metadata_enhancer.os, 'replace', side_effect=OSError('busy')):
+            with self.assertLogs('autoblog.metadata', level='ERROR'):
+                self.assertFalse(metadata_enhancer.flush('job1'))
+
+        self.assertEqual(self._read('job1'), before)
+
+        self.assertTrue(metadata_enhancer.flush('job1'))
+        self.assertEqual(self._read('job1')['news_api_requests'], 5)
+        self.assertEqual(os.listdir(os.path.join('data', 'metadata')), ['job_job1.json'])
+
+    def test_flush_all_writes_every_dirty_job(self):
+        """flush_all은 저장되지 않은 모든 작업을 저장해야 함"""
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=1)
+        metadata_enhancer.track_llm_usage('job2', 'openai', tokens_used=1000, model_name='gpt-4')
+
+        self.assertTrue(metadata_enhancer.flush_all())
+
+        self.assertEqual(self._read('job1')['news_api_requests'], 1)
+        job2 = self._read('job2')
+        self.assertEqual(job2['openai_tokens'], 1000)
+        self.assertEqual(job2['openai_model'], 'gpt-4')
+        self.assertEqual(metadata_enhancer._dirty, set())
+
+    def test_track_batch_matches_separate_calls(self):
+        """track_batch는 같은 이벤트를 개별 track_* 함수로 기록한 것과 같은 파일을 만들어야 함"""
+        metadata_enhancer.track_performance('job1', 'trend_analysis', start_time=10.0, end_time=12.5)
+        metadata_enhancer.track_api_usage('job1', 'news', requests_made=3)
+        metadata_enhancer.track_llm_usage('job1', 'openai', tokens_used=500)
+        metadata_enhancer.update_job_status('job1', 'success')
+
+        metadata_enhancer.track_batch('job2', [
+            {'kind': 'performance', 'operation': 'trend_analysis', 'start_time': 10.0, 'end_time': 12.5},
+            {'kind': 'api_usage', 'api_name': 'news', 'requests_made': 3},
+            {'kind': 'llm_usage', 'service_name': 'openai', 'tokens_used': 500},
+            {'kind': 'status', 'status': 'success'}
+        ])
+
+        separate = {k: v for k, v in self._read('job1').items() if k not in _TIME_KEYS and k != 'job_id'}
+        batched = {k: v for k, v in self._read('job2').items() if k not in _TIME_KEYS and k != 'job_id'}
+        self.assertEqual(batched, separate)
+        self.assertEqual(batched['status'], 'success')
+        self.assertEqual(batched['trend_analysis_time'], 2.5)
+        self.assertNotIn('job2', metadata_enhancer._dirty)
+
+
+if __name__ == '__main__':
+    unittest.main()
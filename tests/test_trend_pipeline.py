@@ -3,18 +3,26 @@
 
 """
 뉴스 기사 파싱 및 분석 파이프라인 테스트 스크립트
+
+프로젝트 루트에서 `python -m tests.test_trend_pipeline`으로 실행합니다.
 """
 
 import os
 import sys
+import time
 import json
 import logging
-from datetime import datetime
+from logging.handlers import MemoryHandler
+import itertools
+import textwrap
 
-# 모듈 임포트를 위한 경로 추가 - 상위 디렉토리(프로젝트 루트)를 추가합니다.
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.utils.config import ConfigLoader
+from src.utils.logger import LOG_FORMAT, LOG_FORMATTER
 from src.trends.parsers.gnews_parser import GNewsParser
 from src.trends.analyzers.trend_analyzer import GNewsTrendAnalyzer
 from dotenv import load_dotenv
@@ -22,84 +30,124 @@ from dotenv import load_dotenv
 # 환경 변수 로드
 load_dotenv()
 
+# 로그 및 결과 파일 경로
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(TESTS_DIR, 'test_data/logs')
+OUTPUT_DIR = os.path.join(TESTS_DIR, '../data')
+
+# OpenAI API 요청 예시에 사용하는 사용자 프롬프트 템플릿
+OPENAI_USER_TEMPLATE = """
+다음 뉴스 기사를 바탕으로 블로그 게시물을 작성해주세요:
+
+제목: {title}
+설명: {description}
+카테고리: {categories}
+추천 태그: {tags}
+블로그 주제: {topic}
+
+블로그 글은 다음 구조로 작성해주세요:
+1. 제목: 독자의 호기심을 자극하면서 핵심 내용을 담은 매력적인 제목
+2. 도입부: 독자의 관심을 끌 수 있는 흥미로운 시작
+3. 본론: 주요 내용을 2-3개의 소제목으로 나누어 설명
+4. 결론: 핵심 내용 요약 및 독자에게 생각할 거리 제공
+5. 행동 유도: 독자가 다음으로 취할 수 있는 구체적인 행동 제안
+
+마크다운 형식으로 작성해주세요.
+"""
+
+# 이미 생성을 확인한 디렉토리
+_ensured_dirs = set()
+
+def ensure_dir(path):
+    """디렉토리가 없으면 생성합니다. (프로세스 안에서 한 번만 확인)"""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
 # 로깅 설정
 def setup_logging():
     """로깅 설정을 초기화합니다."""
-    log_dir = os.path.join(os.path.dirname(__file__), 'test_data/logs')
-    os.makedirs(log_dir, exist_ok=True)
+    ensure_dir(LOG_DIR)
     
-    log_file = os.path.join(log_dir, f'article_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+    log_file = os.path.join(LOG_DIR, f'article_test_{time.strftime("%Y%m%d_%H%M%S")}.log')
     
-    # 루트 로거 설정
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    
-    # 파일 핸들러
+    # 파일 로그는 메모리에 모았다가 256개마다 또는 ERROR 이상이 발생하면 기록
+    # (종료 시에는 logging.shutdown이 남은 레코드를 기록)
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    
-    # 포맷 설정
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    file_handler.setFormatter(LOG_FORMATTER)
+    memory_handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler)
     
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 루트 로거 설정 (force=True로 기존 핸들러를 교체하여 반복 호출 시 중복 출력 방지)
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            memory_handler,
+            logging.StreamHandler()
+        ],
+        force=True
+    )
     
-    return logger
+    return logging.getLogger()
+
+
 
+def dump_json(data):
+    """데이터를 들여쓰기된 JSON 바이트로 직렬화합니다. (orjson이 없으면 json 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 def save_results(trending_articles, analyzed_articles):
     """결과를 JSON 파일로 저장합니다."""
-    output_dir = os.path.join(os.path.dirname(__file__), '../data')
-    os.makedirs(output_dir, exist_ok=True)
+    ensure_dir(OUTPUT_DIR)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     
     # 원본 트렌드 저장
-    raw_file = os.path.join(output_dir, f'raw_articles_{timestamp}.json')
-    with open(raw_file, 'w', encoding='utf-8') as f:
-        json.dump(trending_articles, f, ensure_ascii=False, indent=2)
+    raw_file = os.path.join(OUTPUT_DIR, f'raw_articles_{timestamp}.json')
+    with open(raw_file, 'wb') as f:
+        f.write(dump_json(trending_articles))
     
     # 분석된 트렌드 저장
-    analyzed_file = os.path.join(output_dir, f'analyzed_articles_{timestamp}.json')
-    with open(analyzed_file, 'w', encoding='utf-8') as f:
-        json.dump(analyzed_articles, f, ensure_ascii=False, indent=2)
+    analyzed_file = os.path.join(OUTPUT_DIR, f'analyzed_articles_{timestamp}.json')
+    with open(analyzed_file, 'wb') as f:
+        f.write(dump_json(analyzed_articles))
     
     return raw_file, analyzed_file
 
 
 def display_article(article, index=None, detailed=False):
-    """기사 정보를 화면에 표시합니다."""
+    """기사 정보를 화면에 표시할 문자열로 만듭니다. (출력은 호출하는 쪽에서 한 번에 수행)"""
     prefix = f"{index}. " if index is not None else ""
+    get = article.get
     
-    print(f"\n{prefix}제목: {article.get('title', '')}")
-    print(f"   출처: {article.get('source', {}).get('name', '')}")
-    print(f"   카테고리: {article.get('category', '')}")
+    parts = [
+        f"\n{prefix}제목: {get('title', '')}",
+        f"   출처: {(get('source') or {}).get('name', '')}",
+        f"   카테고리: {get('category', '')}"
+    ]
     
     if detailed:
-        print(f"   설명: {article.get('description', '')}")
-        print(f"   URL: {article.get('url', '')}")
-        print(f"   발행일: {article.get('published_at', '')}")
+        parts.append(f"   설명: {get('description', '')}")
+        parts.append(f"   URL: {get('url', '')}")
+        parts.append(f"   발행일: {get('published_at', '')}")
         if 'trend_score' in article:
-            print(f"   트렌드 점수: {article.get('trend_score', 0):.1f}")
+            parts.append(f"   트렌드 점수: {article['trend_score']:.1f}")
     
     # 분석 결과 표시
     if 'popularity_score' in article:
-        print(f"   인기도 점수: {article.get('popularity_score', 0):.1f}")
-        print(f"   수익 잠재력: {article.get('revenue_potential', '')}")
-        print(f"   추정 카테고리: {', '.join(article.get('estimated_categories', []))}")
-        print(f"   추천 태그: {', '.join(article.get('recommended_tags', []))}")
+        parts.append(f"   인기도 점수: {article['popularity_score']:.1f}")
+        parts.append(f"   수익 잠재력: {get('revenue_potential', '')}")
+        parts.append(f"   추정 카테고리: {', '.join(get('estimated_categories', []))}")
+        parts.append(f"   추천 태그: {', '.join(get('recommended_tags', []))}")
         
         # 블로그 주제 제안 표시
         if 'blog_topic' in article:
-            print(f"   블로그 주제: {article.get('blog_topic', '')}")
+            parts.append(f"   블로그 주제: {article['blog_topic']}")
+    
+    return '\n'.join(parts)
 
 
 def main():
@@ -126,9 +174,9 @@ def main():
             return
         
         # 수집된 뉴스 기사 간략 정보 출력
-        print("\n=== 수집된 뉴스 기사 ===")
-        for i, article in enumerate(trending_articles, 1):
-            display_article(article, i)
+        chunks = ["\n=== 수집된 뉴스 기사 ==="]
+        chunks.extend(map(display_article, trending_articles, itertools.count(1)))
+        sys.stdout.write('\n'.join(chunks) + '\n')
         
         # 2. 뉴스 기사 분석
         logger.info("2. 뉴스 기사 분석 시작")
@@ -141,52 +189,43 @@ def main():
             return
         
         # 분석된 뉴스 기사 정보 출력
-        print("\n=== 분석된 뉴스 기사 ===")
+        chunks = ["\n=== 분석된 뉴스 기사 ==="]
         for i, article in enumerate(analyzed_articles, 1):
-            display_article(article, i, detailed=True)
+            chunks.append(display_article(article, i, detailed=True))
             
             # 기사 요약 표시
             if 'summary' in article:
-                print("\n   [요약]")
-                print(f"   {article['summary'].replace('\n', '\n   ')}")
+                chunks.append("\n   [요약]")
+                chunks.append(textwrap.indent(article['summary'], '   '))
             
             # 구분선 추가
-            print("\n" + "-" * 80)
+            chunks.append("\n" + "-" * 80)
+        sys.stdout.write('\n'.join(chunks) + '\n')
         
         # 3. 결과 저장
         raw_file, analyzed_file = save_results(trending_articles, analyzed_articles)
         logger.info(f"3. 결과 저장 완료: {raw_file}, {analyzed_file}")
         
         # 4. OpenAI API 요청에 사용할 수 있는 데이터 구조 예시
-        print("\n=== OpenAI API 요청 데이터 형식 예시 ===")
+        chunks = ["\n=== OpenAI API 요청 데이터 형식 예시 ==="]
         if analyzed_articles:
             example_article = analyzed_articles[0]
             
             openai_prompt = {
                 "messages": [
                     {"role": "system", "content": "당신은 전문적인 블로그 작가입니다. 제공된 뉴스 기사를 바탕으로 흥미로운 블로그 게시물을 작성해주세요."},
-                    {"role": "user", "content": f"""
-다음 뉴스 기사를 바탕으로 블로그 게시물을 작성해주세요:
-
-제목: {example_article.get('title', '')}
-설명: {example_article.get('description', '')}
-카테고리: {', '.join(example_article.get('estimated_categories', []))}
-추천 태그: {', '.join(example_article.get('recommended_tags', []))}
-블로그 주제: {example_article.get('blog_topic', '')}
-
-블로그 글은 다음 구조로 작성해주세요:
-1. 제목: 독자의 호기심을 자극하면서 핵심 내용을 담은 매력적인 제목
-2. 도입부: 독자의 관심을 끌 수 있는 흥미로운 시작
-3. 본론: 주요 내용을 2-3개의 소제목으로 나누어 설명
-4. 결론: 핵심 내용 요약 및 독자에게 생각할 거리 제공
-5. 행동 유도: 독자가 다음으로 취할 수 있는 구체적인 행동 제안
-
-마크다운 형식으로 작성해주세요.
-"""}
+                    {"role": "user", "content": OPENAI_USER_TEMPLATE.format_map({
+                        'title': example_article.get('title', ''),
+                        'description': example_article.get('description', ''),
+                        'categories': ', '.join(example_article.get('estimated_categories', [])),
+                        'tags': ', '.join(example_article.get('recommended_tags', [])),
+                        'topic': example_article.get('blog_topic', '')
+                    })}
                 ]
             }
             
-            print(json.dumps(openai_prompt, ensure_ascii=False, indent=2))
+            chunks.append(dump_json(openai_prompt).decode('utf-8'))
+        sys.stdout.write('\n'.join(chunks) + '\n')
         
         logger.info("=== 뉴스 기사 파이프라인 테스트 완료 ===")
     
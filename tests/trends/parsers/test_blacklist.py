@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+블랙리스트 검사기에 대한 유닛 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.trends.parsers import blacklist
+from src.trends.parsers.blacklist import BlacklistMatcher
+
+# (텍스트, 블랙리스트 포함 여부)
+_CASES = (
+    ('온라인 도박 단속', True),
+    ('Casino 광고 규제', True),
+    ('성인', True),
+    ('빅데이터 분석', False),
+    ('', False),
+    (None, False)
+)
+
+
+class TestBlacklistMatcher(unittest.TestCase):
+    """BlacklistMatcher 클래스에 대한 테스트"""
+
+    TERMS = ['도박', '성인', 'CASINO']
+
+    def _check_cases(self, matcher):
+        """모든 테스트 텍스트의 검사 결과 확인"""
+        for text, expected in _CASES:
+            with self.subTest(text=text):
+                self.assertEqual(matcher.contains(text), expected)
+
+    @unittest.skipIf(blacklist.ahocorasick is None, 'pyahocorasick이 설치되어 있지 않음')
+    def test_automaton_matcher(self):
+        """오토마톤 검사 테스트"""
+        self._check_cases(BlacklistMatcher(self.TERMS))
+
+    def test_regex_matcher(self):
+        """pyahocorasick이 없을 때의 정규식 검사 테스트"""
+        with patch.object(blacklist, 'ahocorasick', None):
+            matcher = BlacklistMatcher(self.TERMS)
+
+        self._check_cases(matcher)
+
+    def test_empty_blacklist(self):
+        """빈 블랙리스트는 어떤 텍스트도 걸러내지 않아야 함"""
+        matcher = BlacklistMatcher([])
+
+        self.assertFalse(matcher)
+        self.assertFalse(matcher.contains('온라인 도박 단속'))
+
+
+if __name__ == '__main__':
+    unittest.main()
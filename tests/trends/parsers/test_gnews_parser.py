@@ -8,22 +8,128 @@ GNews 파서에 대한 유닛 테스트
 import unittest
 from unittest.mock import patch, Mock, MagicMock
 import json
-import os
-import sys
-from datetime import datetime, timedelta
-
-# 테스트 대상 모듈 임포트를 위한 경로 추가
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+import re
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 
 from src.trends.parsers.gnews_parser import GNewsParser
 
+# 테스트용 기사 데이터 (읽기 전용 - 변경이 필요한 테스트는 dict()로 복사해서 사용)
+_CANNED_FETCH_ARTICLES = (
+    MappingProxyType({
+        'title': '테스트 기사 제목 1',
+        'description': '테스트 기사 설명 1',
+        'content': '테스트 기사 내용 1',
+        'url': 'https://example.com/article1',
+        'publishedAt': '2023-01-01T12:00:00Z',
+        'source': {
+            'name': '테스트 소스 1',
+            'url': 'https://example.com'
+        }
+    }),
+    MappingProxyType({
+        'title': '테스트 기사 제목 2',
+        'description': '테스트 기사 설명 2',
+        'content': '테스트 기사 내용 2',
+        'url': 'https://example.com/article2',
+        'publishedAt': '2023-01-01T13:00:00Z',
+        'source': {
+            'name': '테스트 소스 2',
+            'url': 'https://example2.com'
+        }
+    })
+)
+
+_CANNED_SEARCH_ARTICLES = (
+    MappingProxyType({
+        'title': '인공지능 관련 기사 1',
+        'description': '인공지능 기술에 대한 설명',
+        'content': '인공지능 기술 내용...',
+        'url': 'https://example.com/ai1',
+        'publishedAt': '2023-01-01T12:00:00Z',
+        'source': {
+            'name': 'AI 뉴스',
+            'url': 'https://ainews.com'
+        }
+    }),
+)
+
+_PROCESS_ARTICLES = (
+    MappingProxyType({
+        'title': '인공지능 기술 혁신이 일어나고 있다',
+        'description': '인공지능이 다양한 산업에 혁신을 가져오고 있습니다.',
+        'url': 'https://example.com/article1',
+        'source': {'name': '테크 뉴스'},
+        'category': 'technology'
+    }),
+    MappingProxyType({
+        'title': '인공지능 기술의 발전과 미래',
+        'description': '인공지능 기술이 어떻게 발전하고 있는지 알아봅니다.',
+        'url': 'https://example.com/article2',
+        'source': {'name': '미래 뉴스'},
+        'category': 'technology'
+    }),
+    MappingProxyType({
+        'title': '클라우드 컴퓨팅 시장 성장세',
+        'description': '클라우드 컴퓨팅 시장이 계속해서 성장하고 있습니다.',
+        'url': 'https://example.com/article3',
+        'source': {'name': '비즈니스 뉴스'},
+        'category': 'business'
+    })
+)
+
+_PROCESS_SEARCH_ARTICLES = (
+    MappingProxyType({
+        'title': '인공지능 관련 추가 기사',
+        'description': '인공지능에 대한 추가 정보',
+        'url': 'https://example.com/article4',
+        'source': {'name': '과학 뉴스'},
+    }),
+)
+
+_TRENDING_ARTICLES = (
+    MappingProxyType({
+        'title': '인공지능 기술 혁신',
+        'description': '인공지능이 다양한 산업에 혁신을 가져오고 있습니다.',
+        'url': 'https://example.com/article1',
+        'published_at': '2023-01-01T12:00:00Z',
+        'source': {'name': '테크 뉴스'},
+        'category': 'technology'
+    }),
+    MappingProxyType({
+        'title': '블록체인 시장 동향',
+        'description': '블록체인 기술이 금융을 넘어 다양한 분야로 확장 중입니다.',
+        'url': 'https://example.com/article2',
+        'published_at': '2023-01-01T11:00:00Z',
+        'source': {'name': '경제 뉴스'},
+        'category': 'business'
+    }),
+    MappingProxyType({
+        'title': '연예인 스캔들',
+        'description': '최근 연예계 스캔들에 대한 기사입니다.',
+        'url': 'https://example.com/article3',
+        'published_at': '2023-01-01T13:00:00Z',
+        'source': {'name': '연예 뉴스'},
+        'category': 'entertainment'
+    })
+)
+
+# 기사에 반드시 있어야 하는 필드
+_REQUIRED_ARTICLE_FIELDS = frozenset(('title', 'description', 'url', 'source'))
+_REQUIRED_TREND_FIELDS = _REQUIRED_ARTICLE_FIELDS | {'category'}
+
+# 카테고리별 모의 기사에 공통으로 들어가는 필드 (참조로 공유)
+_CATEGORY_STUB_1 = {'source': {'name': '테스트 뉴스'}}
+_CATEGORY_STUB_2 = {'source': {'name': '테스트 뉴스 2'}}
+
 
 class TestGNewsParser(unittest.TestCase):
     """GNewsParser 클래스에 대한 테스트"""
 
-    def setUp(self):
-        """각 테스트 전에 실행되는 설정"""
-        self.test_config = {
+    @classmethod
+    def setUpClass(cls):
+        """테스트 클래스에서 한 번만 실행되는 설정 (설정은 테스트에서 읽기만 함)"""
+        cls.test_config = {
             'trends': {
                 'gnews': {
                     'api_key': '508256b08f03d46f2a09dc270eaef6a3',
@@ -40,6 +146,16 @@ class TestGNewsParser(unittest.TestCase):
                 }
             }
         }
+        # 블랙리스트 전체를 한 번에 검사하는 정규식 (파서 구현과 결과가 같아야 함)
+        cls._bl_re = re.compile('|'.join(re.escape(word) for word in cls.test_config['trends']['analysis']['blacklist']), re.IGNORECASE)
+
+    def setUp(self):
+        """각 테스트 전에 실행되는 설정"""
+        # 파서가 생성 시 만드는 HTTP 세션을 모킹
+        patcher = patch('src.trends.parsers.gnews_parser.requests.Session')
+        self.mock_session = patcher.start()
+        self.addCleanup(patcher.stop)
+        
         self.parser = GNewsParser(self.test_config)
 
     def test_init(self):
@@ -52,38 +168,11 @@ class TestGNewsParser(unittest.TestCase):
         self.assertEqual(self.parser.max_trends, 5)
         self.assertEqual(self.parser.blacklist, ['성인', '음란', '도박'])
 
-    @patch('src.trends.parsers.gnews_parser.requests.Session')
-    def test_fetch_top_news(self, mock_session):
+    def test_fetch_top_news(self):
         """_fetch_top_news 메서드 테스트"""
         # Mock 응답 설정
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'articles': [
-                {
-                    'title': '테스트 기사 제목 1',
-                    'description': '테스트 기사 설명 1',
-                    'content': '테스트 기사 내용 1',
-                    'url': 'https://example.com/article1',
-                    'publishedAt': '2023-01-01T12:00:00Z',
-                    'source': {
-                        'name': '테스트 소스 1',
-                        'url': 'https://example.com'
-                    }
-                },
-                {
-                    'title': '테스트 기사 제목 2',
-                    'description': '테스트 기사 설명 2',
-                    'content': '테스트 기사 내용 2',
-                    'url': 'https://example.com/article2',
-                    'publishedAt': '2023-01-01T13:00:00Z',
-                    'source': {
-                        'name': '테스트 소스 2',
-                        'url': 'https://example2.com'
-                    }
-                }
-            ]
-        }
+        mock_session = self.mock_session
+        mock_response = MagicMock(**{'status_code': 200, 'json.return_value': {'articles': list(_CANNED_FETCH_ARTICLES)}})
         
         # Mock 세션 설정
         mock_session.return_value.get.return_value = mock_response
@@ -102,43 +191,30 @@ class TestGNewsParser(unittest.TestCase):
         args, kwargs = mock_session.return_value.get.call_args
         self.assertIn('https://gnews.io/api/v4/top-headlines', args)
 
-    @patch('src.trends.parsers.gnews_parser.requests.Session')
-    def test_search_news(self, mock_session):
-        """_search_news 메서드 테스트"""
+    def test_fetch_top_news_with_from_date(self):
+        """_fetch_top_news 메서드 테스트 - 검색 시작 시각 지정"""
         # Mock 응답 설정
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'articles': [
-                {
-                    'title': '인공지능 관련 기사 1',
-                    'description': '인공지능 기술에 대한 설명',
-                    'content': '인공지능 기술 내용...',
-                    'url': 'https://example.com/ai1',
-                    'publishedAt': '2023-01-01T12:00:00Z',
-                    'source': {
-                        'name': 'AI 뉴스',
-                        'url': 'https://ainews.com'
-                    }
-                }
-            ]
-        }
+        mock_session = self.mock_session
+        mock_response = MagicMock(**{'status_code': 200, 'json.return_value': {'articles': list(_CANNED_SEARCH_ARTICLES)}})
         
         # Mock 세션 설정
         mock_session.return_value.get.return_value = mock_response
         
         # 메서드 호출
-        articles = self.parser._search_news('인공지능')
+        articles = self.parser._fetch_top_news('technology', '2023-01-01T00:00:00Z')
         
         # 검증
         self.assertEqual(len(articles), 1)
         self.assertEqual(articles[0]['title'], '인공지능 관련 기사 1')
-        self.assertEqual(articles[0]['keyword'], '인공지능')
+        self.assertEqual(articles[0]['category'], 'technology')
+        self.assertEqual(articles[0]['published_ts'], datetime(2023, 1, 1, 12, tzinfo=timezone.utc).timestamp())
         
         # API 호출 검증
         mock_session.return_value.get.assert_called_once()
         args, kwargs = mock_session.return_value.get.call_args
-        self.assertIn('https://gnews.io/api/v4/search', args)
+        self.assertIn('https://gnews.io/api/v4/top-headlines', args)
+        self.assertEqual(kwargs['params']['from'], '2023-01-01T00:00:00Z')
+        self.assertEqual(kwargs['params']['topic'], 'technology')
 
     def test_extract_keywords(self):
         """_extract_keywords 메서드 테스트"""
@@ -146,14 +222,14 @@ class TestGNewsParser(unittest.TestCase):
         text = "인공지능 기술이 발전하면서 새로운 일자리가 창출되고 있습니다."
         keywords = self.parser._extract_keywords(text)
         
-        expected_keywords = [
+        expected_keywords = {
             '인공지능', '기술', '발전', '새로운', '일자리', '창출',
             '인공지능 기술', '기술 발전', '발전 새로운', '새로운 일자리', '일자리 창출',
             '인공지능 기술 발전', '기술 발전 새로운', '발전 새로운 일자리', '새로운 일자리 창출'
-        ]
+        }
         
-        for keyword in expected_keywords:
-            self.assertIn(keyword, keywords)
+        missing = expected_keywords - set(keywords)
+        self.assertFalse(missing, f"누락된 키워드: {missing}")
         
         # 특수문자 제거 테스트
         text_with_special = "인공지능(AI) 기술이 발전하면서 '새로운' 일자리가 창출되고 있습니다."
@@ -177,77 +253,53 @@ class TestGNewsParser(unittest.TestCase):
         # 숫자로만 이루어진 키워드
         self.assertFalse(self.parser._is_valid_keyword('12345'))
 
-    @patch('src.trends.parsers.gnews_parser.GNewsParser._fetch_top_news')
-    @patch('src.trends.parsers.gnews_parser.GNewsParser._search_news')
-    def test_process_articles(self, mock_search, mock_fetch):
-        """뉴스 기사 처리 메서드 테스트"""
-        # 테스트 기사 데이터
-        articles = [
-            {
-                'title': '인공지능 기술 혁신이 일어나고 있다',
-                'description': '인공지능이 다양한 산업에 혁신을 가져오고 있습니다.',
-                'url': 'https://example.com/article1',
-                'source': {'name': '테크 뉴스'},
-                'category': 'technology'
-            },
-            {
-                'title': '인공지능 기술의 발전과 미래',
-                'description': '인공지능 기술이 어떻게 발전하고 있는지 알아봅니다.',
-                'url': 'https://example.com/article2',
-                'source': {'name': '미래 뉴스'},
-                'category': 'technology'
-            },
-            {
-                'title': '클라우드 컴퓨팅 시장 성장세',
-                'description': '클라우드 컴퓨팅 시장이 계속해서 성장하고 있습니다.',
-                'url': 'https://example.com/article3',
-                'source': {'name': '비즈니스 뉴스'},
-                'category': 'business'
-            }
-        ]
+    def test_contains_blacklisted_terms(self):
+        """_contains_blacklisted_terms 메서드 테스트"""
+        texts = ['성인 콘텐츠 규제 강화', '온라인 도박 단속', '빅데이터 분석', '인공지능 기술 동향', '']
         
-        # 추가 검색 기사 데이터 (모킹)
-        mock_search.return_value = [
-            {
-                'title': '인공지능 관련 추가 기사',
-                'description': '인공지능에 대한 추가 정보',
-                'url': 'https://example.com/article4',
-                'source': {'name': '과학 뉴스'},
-            }
-        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(self.parser._contains_blacklisted_terms(text), bool(self._bl_re.search(text)))
         
-        # 기사 처리 메서드 호출 (이름이 변경되었다고 가정)
-        processed_articles = self.parser._process_articles(articles)
+        self.assertTrue(self.parser._contains_blacklisted_terms('성인 콘텐츠 규제 강화'))
+        self.assertFalse(self.parser._contains_blacklisted_terms('빅데이터 분석'))
+
+    def test_process_articles(self):
+        """뉴스 기사 처리 테스트 - 중복 제거 후 트렌드 기사 선정"""
+        # 테스트 기사 데이터 (카테고리 기사 + 추가 기사 + 중복 기사, trend_score가 추가되므로 복사해서 사용)
+        articles = [dict(article) for article in _PROCESS_ARTICLES + _PROCESS_SEARCH_ARTICLES + _PROCESS_ARTICLES[:1]]
+        
+        # 중복 제거 및 트렌드 기사 선정
+        filtered_articles = self.parser._filter_and_deduplicate_articles(articles)
+        processed_articles = self.parser._extract_trending_articles(filtered_articles)
         
         # 검증
+        self.assertEqual(len(filtered_articles), 4)  # URL이 같은 기사는 한 번만 남아야 함
         self.assertGreaterEqual(len(processed_articles), 3)  # 최소 원본 기사 수만큼 있어야 함
         
         # 기사 내용 검증
         article = processed_articles[0]
-        self.assertIn('title', article)
-        self.assertIn('description', article)
-        self.assertIn('url', article)
-        self.assertIn('source', article)
+        self.assertTrue(_REQUIRED_ARTICLE_FIELDS.issubset(article), article.keys())
 
     @patch('src.trends.parsers.gnews_parser.GNewsParser._fetch_top_news')
     def test_get_trends(self, mock_fetch):
         """get_trends 메서드 테스트 - 뉴스 기사 반환 기능"""
         # 각 카테고리별 가짜 기사 반환
-        def mock_fetch_by_category(category):
+        def mock_fetch_by_category(category, from_date=None):
             return [
                 {
                     'title': f'{category} 관련 인공지능 기사',
                     'description': f'{category}에서 인공지능의 활용',
                     'url': f'https://example.com/{category}/1',
-                    'source': {'name': '테스트 뉴스'},
-                    'category': category
+                    'category': category,
+                    **_CATEGORY_STUB_1
                 },
                 {
                     'title': f'{category} 분야의 블록체인 기술',
                     'description': f'{category}에서 블록체인 기술의 적용',
                     'url': f'https://example.com/{category}/2',
-                    'source': {'name': '테스트 뉴스 2'},
-                    'category': category
+                    'category': category,
+                    **_CATEGORY_STUB_2
                 }
             ]
         
@@ -263,11 +315,7 @@ class TestGNewsParser(unittest.TestCase):
         
         # 기사 형식 검증
         for article in articles:
-            self.assertIn('title', article)
-            self.assertIn('description', article)
-            self.assertIn('url', article)
-            self.assertIn('source', article)
-            self.assertIn('category', article)
+            self.assertTrue(_REQUIRED_TREND_FIELDS.issubset(article), article.keys())
             
         # 호출 횟수 검증 (카테고리 수만큼 호출되어야 함)
         self.assertEqual(mock_fetch.call_count, len(self.parser.categories))
@@ -277,39 +325,10 @@ class TestGNewsParser(unittest.TestCase):
         articles_empty = self.parser.get_trends()
         self.assertEqual(articles_empty, [])
 
-    @patch('src.trends.parsers.gnews_parser.GNewsParser._contains_korean')
-    def test_extract_trending_articles(self, mock_contains_korean):
+    def test_extract_trending_articles(self):
         """_extract_trending_articles 메서드 테스트"""
-        # 모킹 설정
-        mock_contains_korean.return_value = True
-        
-        # 테스트 기사 데이터
-        articles = [
-            {
-                'title': '인공지능 기술 혁신',
-                'description': '인공지능이 다양한 산업에 혁신을 가져오고 있습니다.',
-                'url': 'https://example.com/article1',
-                'published_at': '2023-01-01T12:00:00Z',
-                'source': {'name': '테크 뉴스'},
-                'category': 'technology'
-            },
-            {
-                'title': '블록체인 시장 동향',
-                'description': '블록체인 기술이 금융을 넘어 다양한 분야로 확장 중입니다.',
-                'url': 'https://example.com/article2',
-                'published_at': '2023-01-01T11:00:00Z',
-                'source': {'name': '경제 뉴스'},
-                'category': 'business'
-            },
-            {
-                'title': '연예인 스캔들',
-                'description': '최근 연예계 스캔들에 대한 기사입니다.',
-                'url': 'https://example.com/article3',
-                'published_at': '2023-01-01T13:00:00Z',
-                'source': {'name': '연예 뉴스'},
-                'category': 'entertainment'
-            }
-        ]
+        # 테스트 기사 데이터 (trend_score가 추가되므로 복사해서 사용)
+        articles = [dict(article) for article in _TRENDING_ARTICLES]
         
         # 메서드 호출
         trending_articles = self.parser._extract_trending_articles(articles)
@@ -322,11 +341,8 @@ class TestGNewsParser(unittest.TestCase):
             self.assertIn('trend_score', article)
         
         # 정렬 검증 (트렌드 점수 기준 내림차순)
-        for i in range(len(trending_articles) - 1):
-            self.assertGreaterEqual(
-                trending_articles[i].get('trend_score', 0),
-                trending_articles[i+1].get('trend_score', 0)
-            )
+        scores = [article['trend_score'] for article in trending_articles]
+        self.assertEqual(scores, sorted(scores, reverse=True))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 뉴스 파서에 대한 유닛 테스트
+"""
+
+import os
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from src.trends.parsers.naver_parser import NaverNewsParser
+
+
+def _item(query, index=1):
+    """검색 키워드에 해당하는 네이버 API 응답 항목을 생성"""
+    return {
+        'title': f'<b>{query}</b> 뉴스 {index}',
+        'description': f'{query} 관련 &quot;기사&quot; 설명 {index}',
+        'link': f'https://n.news.naver.com/{query}/{index}',
+        'pubDate': 'Mon, 01 Jan 2024 09:00:00 +0900'
+    }
+
+
+class TestNaverNewsParser(unittest.TestCase):
+    """NaverNewsParser 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """테스트 클래스에서 한 번만 실행되는 설정 (설정은 테스트에서 읽기만 함)"""
+        cls.test_config = {
+            'trends': {
+                'max_trends': 10,
+                'analysis': {
+                    'blacklist': ['도박', '성인']
+                }
+            }
+        }
+
+    def setUp(self):
+        """각 테스트 전에 실행되는 설정"""
+        patcher = patch.dict(os.environ, {'NAVER_CLIENT_ID': 'test-id', 'NAVER_CLIENT_SECRET': 'test-secret'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.parser = NaverNewsParser(self.test_config)
+        self.parser.request_interval = 0  # 테스트에서는 요청 간격 없이 실행
+
+    def _use_transport(self, handler):
+        """파서가 만드는 HTTP 클라이언트를 MockTransport를 사용하는 클라이언트로 교체"""
+        patcher = patch.object(
+            self.parser, '_create_http_client',
+            side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_keep_query_order(self):
+        """응답 완료 순서와 관계없이 결과는 키워드 순서대로 반환되어야 함"""
+        delays = {'느림': 0.05, '보통': 0.02, '빠름': 0}
+        completed = []
+
+        async def handler(request):
+            query = request.url.params['query']
+            await asyncio.sleep(delays[query])
+            completed.append(query)
+            return httpx.Response(200, json={'items': [_item(query)]})
+
+        self._use_transport(handler)
+        results = asyncio.run(self.parser._fetch_all_news_async(['느림', '보통', '빠름']))
+
+        self.assertEqual(completed, ['빠름', '보통', '느림'])
+        self.assertEqual([[article['title'] for article in result] for result in results],
+                         [['느림 뉴스 1'], ['보통 뉴스 1'], ['빠름 뉴스 1']])
+        self.assertEqual(results[0][0]['description'], '느림 관련 "기사" 설명 1')
+        self.assertEqual(results[0][0]['source']['url'], 'https://n.news.naver.com')
+
+    def test_blacklisted_articles_are_filtered(self):
+        """블랙리스트 용어가 포함된 기사는 HTML 태그를 제거한 뒤 걸러져야 함"""
+        def handler(request):
+            return httpx.Response(200, json={'items': [
+                {'title': '<b>도박</b> 사이트 단속', 'description': '', 'link': 'https://example.com/1'},
+                {'title': '인공지능 &amp; 로봇', 'description': '성인 인증 도입', 'link': 'https://example.com/2'},
+                {'title': '인공지능 &amp; 로봇', 'description': '산업 동향', 'link': 'https://example.com/3'}
+            ]})
+
+        self._use_transport(handler)
+        results = asyncio.run(self.parser._fetch_all_news_async(['인공지능']))
+
+        self.assertEqual([article['url'] for article in results[0]], ['https://example.com/3'])
+        self.assertEqual(results[0][0]['title'], '인공지능 & 로봇')
+
+    def test_failure_is_isolated_to_one_query(self):
+        """한 키워드의 요청 실패는 다른 키워드의 결과에 영향을 주지 않아야 함"""
+        def handler(request):
+            query = request.url.params['query']
+            if query == '오류':
+                return httpx.Response(500, text='server error')
+            if query == '연결':
+                raise httpx.ConnectError('connection refused', request=request)
+            if query == '예외':
+                raise ValueError('unexpected')
+            return httpx.Response(200, json={'items': [_item(query)]})
+
+        self._use_transport(handler)
+        with self.assertLogs('autoblog.trends.naver', level='ERROR') as logs:
+            results = asyncio.run(self.parser._fetch_all_news_async(['오류', '정상', '연결', '예외']))
+
+        self.assertEqual([len(result) for result in results], [0, 1, 0, 0])
+        self.assertEqual(results[1][0]['title'], '정상 뉴스 1')
+        self.assertEqual(len(logs.records), 3)
+
+    def test_get_trends_collects_remaining_keywords(self):
+        """get_trends는 실패한 키워드를 제외한 나머지 기사를 반환해야 함"""
+        def handler(request):
+            query = request.url.params['query']
+            if query == 'AI':
+                return httpx.Response(500, text='server error')
+            return httpx.Response(200, json={'items': [_item(query)]})
+
+        self._use_transport(handler)
+        with self.assertLogs('autoblog.trends.naver', level='ERROR'):
+            trends = self.parser.get_trends()
+
+        self.assertEqual(sorted(article['url'] for article in trends), sorted(
+            f'https://n.news.naver.com/{query}/1' for query in ['인공지능', '빅데이터', '클라우드', '메타버스', '블록체인']
+        ))
+
+    def test_get_trends_inside_running_loop_raises(self):
+        """실행 중인 이벤트 루프 안에서 호출하면 빈 목록 대신 RuntimeError가 발생해야 함"""
+        requests_made = []
+
+        def handler(request):
+            requests_made.append(request)
+            return httpx.Response(200, json={'items': []})
+
+        self._use_transport(handler)
+
+        async def call_from_loop():
+            return self.parser.get_trends()
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(call_from_loop())
+        self.assertEqual(requests_made, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
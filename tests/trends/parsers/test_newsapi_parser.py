@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+NewsAPI 파서에 대한 유닛 테스트
+"""
+
+import os
+import time
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from src.trends.parsers.newsapi_parser import NewsAPIParser
+
+
+def _article(category, index=1):
+    """카테고리에 해당하는 NewsAPI 응답 기사를 생성"""
+    return {
+        'title': f'{category} 뉴스 {index}',
+        'description': f'{category} 관련 기사 설명 {index}',
+        'content': f'{category} 관련 기사 내용 {index}',
+        'url': f'https://example.com/{category}/{index}',
+        'urlToImage': '',
+        'publishedAt': '2024-01-01T00:00:00Z',
+        'source': {'name': '테스트 소스'}
+    }
+
+
+def _ok(articles):
+    """정상 NewsAPI 응답을 생성"""
+    return httpx.Response(200, json={'status': 'ok', 'articles': articles})
+
+
+class TestNewsAPIParser(unittest.TestCase):
+    """NewsAPIParser 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """테스트 클래스에서 한 번만 실행되는 설정 (설정은 테스트에서 읽기만 함)"""
+        cls.test_config = {
+            'trends': {
+                'newsapi': {
+                    'country': 'kr',
+                    'categories': ['technology', 'business', 'science']
+                },
+                'max_trends': 10,
+                'analysis': {
+                    'blacklist': ['도박', '성인']
+                }
+            }
+        }
+
+    def setUp(self):
+        """각 테스트 전에 실행되는 설정"""
+        patcher = patch.dict(os.environ, {'NEWSAPI_KEY': 'test-key'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.parser = NewsAPIParser(self.test_config)
+        self.parser.request_interval = 0  # 테스트에서는 요청 간격 없이 실행
+
+    def _use_transport(self, handler):
+        """파서가 만드는 HTTP 클라이언트를 MockTransport를 사용하는 클라이언트로 교체"""
+        patcher = patch.object(
+            self.parser, '_create_http_client',
+            side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_keep_category_order(self):
+        """응답 완료 순서와 관계없이 결과는 카테고리 순서대로 반환되어야 함"""
+        delays = {'technology': 0.05, 'business': 0.02, 'science': 0}
+        completed = []
+
+        async def handler(request):
+            category = request.url.params['category']
+            await asyncio.sleep(delays[category])
+            completed.append(category)
+            return _ok([_article(category)])
+
+        self.parser.max_concurrent_requests = 3
+        self._use_transport(handler)
+        results = asyncio.run(self.parser._fetch_all_headlines_async(self.parser.categories))
+
+        self.assertEqual(completed, ['science', 'business', 'technology'])
+        self.assertEqual([[article['category'] for article in result] for result in results],
+                         [['technology'], ['business'], ['science']])
+        self.assertEqual(results[0][0]['source']['url'], 'https://example.com')
+
+    def test_request_starts_are_spaced(self):
+        """카테고리 요청은 request_interval 간격으로 시작되어야 함"""
+        started = []
+
+        def handler(request):
+            started.append(time.monotonic())
+            return _ok([])
+
+        self.parser.request_interval = 0.05
+        self._use_transport(handler)
+        asyncio.run(self.parser._fetch_all_headlines_async(self.parser.categories))
+
+        self.assertEqual(len(started), 3)
+        for previous, current in zip(started, started[1:]):
+            self.assertGreaterEqual(current - previous, 0.04)
+
+    def test_blacklisted_articles_are_filtered(self):
+        """블랙리스트 용어가 제목이나 설명에 포함된 기사는 걸러져야 함"""
+        def handler(request):
+            blocked_title = dict(_article('technology', 1), title='온라인 도박 단속')
+            blocked_description = dict(_article('technology', 2), description='성인 인증 도입')
+            return _ok([blocked_title, blocked_description, _article('technology', 3)])
+
+        self._use_transport(handler)
+        results = asyncio.run(self.parser._fetch_all_headlines_async(['technology']))
+
+        self.assertEqual([article['url'] for article in results[0]], ['https://example.com/technology/3'])
+
+    def test_failure_is_isolated_to_one_category(self):
+        """한 카테고리의 요청 실패는 다른 카테고리의 결과에 영향을 주지 않아야 함"""
+        def handler(request):
+            category = request.url.params['category']
+            if category == 'technology':
+                return httpx.Response(429, json={'status': 'error', 'code': 'rateLimited'})
+            if category == 'business':
+                raise httpx.ReadTimeout('timed out', request=request)
+            return _ok([_article(category)])
+
+        self._use_transport(handler)
+        with self.assertLogs('autoblog.trends.newsapi', level='ERROR') as logs:
+            results = asyncio.run(self.parser._fetch_all_headlines_async(self.parser.categories))
+
+        self.assertEqual([len(result) for result in results], [0, 0, 1])
+        self.assertEqual(results[2][0]['category'], 'science')
+        self.assertEqual(len(logs.records), 2)
+
+    def test_get_trends_inside_running_loop_raises(self):
+        """실행 중인 이벤트 루프 안에서 호출하면 빈 목록 대신 RuntimeError가 발생해야 함"""
+        requests_made = []
+
+        def handler(request):
+            requests_made.append(request)
+            return _ok([])
+
+        self._use_transport(handler)
+
+        async def call_from_loop():
+            return self.parser.get_trends()
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(call_from_loop())
+        self.assertEqual(requests_made, [])
+
+
+if __name__ == '__main__':
+    unittest.main()